@@ -58,6 +58,12 @@ class Settings:
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR = "logs"
 
+    # 采集结果缓存有效期（秒），按各数据的更新频率设置，0 表示不缓存
+    FUNDING_RATE_CACHE_TTL = float(os.getenv("FUNDING_RATE_CACHE_TTL", "300"))
+    KLINE_CACHE_TTL = float(os.getenv("KLINE_CACHE_TTL", "30"))
+    LIQUIDATION_CACHE_TTL = float(os.getenv("LIQUIDATION_CACHE_TTL", "30"))
+    NEWS_CACHE_TTL = float(os.getenv("NEWS_CACHE_TTL", "180"))
+
     # 重试配置
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # 秒
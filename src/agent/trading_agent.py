@@ -1,9 +1,17 @@
 import os
 from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages.ai import add_ai_message_chunks
 from loguru import logger
 from config.settings import settings
 from .prompts import SYSTEM_PROMPT, ANALYSIS_PROMPT_TEMPLATE
 
+# 会与显式传入的 API 密钥冲突的环境变量
+CONFLICTING_ENV_VARS = ("ANTHROPIC_API_KEY", "ANTHROPIC_AUTH_TOKEN", "CCH_API_KEY")
+
+# 系统消息内容固定，模块加载时构建一次，每次分析复用
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
 
 class TradingAgent:
     """交易智能体 - 使用 LangChain + Claude 进行市场分析"""
@@ -19,9 +27,8 @@ class TradingAgent:
 
         # 关键：在创建 ChatAnthropic 之前清除冲突的环境变量
         # 这样 LangChain 就不会自动检测到多个 API 密钥
-        env_vars_to_clear = ["ANTHROPIC_API_KEY", "ANTHROPIC_AUTH_TOKEN", "CCH_API_KEY"]
         cleared_vars = {}
-        for var in env_vars_to_clear:
+        for var in CONFLICTING_ENV_VARS:
             if var in os.environ:
                 cleared_vars[var] = os.environ.pop(var)
                 logger.debug(f"临时清除环境变量: {var}")
@@ -42,6 +49,11 @@ class TradingAgent:
 
             self.llm = ChatAnthropic(**llm_kwargs)
 
+            # 底层 Anthropic 客户端在首次使用时才创建，创建时会读取上述环境变量。
+            # 在环境变量清除期间提前创建，之后的分析调用不再读取环境变量，
+            # 多个分析并发调用时无需再修改进程级的环境变量
+            _ = self.llm._client
+
         finally:
             # 恢复环境变量（如果需要的话）
             for var, value in cleared_vars.items():
@@ -64,31 +76,19 @@ class TradingAgent:
         """
         logger.info("开始AI分析...")
 
-        # 在调用时也需要清除环境变量
-        # 因为 LangChain 的底层 Anthropic 客户端会在每次调用时检查环境变量
-        env_vars_to_clear = ["ANTHROPIC_API_KEY", "ANTHROPIC_AUTH_TOKEN", "CCH_API_KEY"]
-        cleared_vars = {}
-        for var in env_vars_to_clear:
-            if var in os.environ:
-                cleared_vars[var] = os.environ.pop(var)
-
         try:
             # 格式化用户消息
             user_message = ANALYSIS_PROMPT_TEMPLATE.format(market_data=market_data)
 
-            # 使用 LangChain 的 invoke 方法
             # 传递 system 和 user 消息
-            from langchain_core.messages import SystemMessage, HumanMessage
-
             messages = [
-                SystemMessage(content=SYSTEM_PROMPT),
+                SYSTEM_MESSAGE,
                 HumanMessage(content=user_message)
             ]
 
-            response = self.llm.invoke(messages)
-
-            # 提取文本内容
-            analysis_result = response.content
+            # 流式接收分析结果，全部消息块接收完后一次合并为完整消息，再读取文本内容
+            chunks = list(self.llm.stream(messages))
+            analysis_result = add_ai_message_chunks(*chunks).content if chunks else ""
 
             logger.info("AI分析完成")
             return analysis_result
@@ -96,7 +96,3 @@ class TradingAgent:
         except Exception as e:
             logger.error(f"AI分析失败: {str(e)}")
             raise
-        finally:
-            # 恢复环境变量
-            for var, value in cleared_vars.items():
-                os.environ[var] = value
@@ -3,15 +3,113 @@
 支持多种通知方式：飞书、邮件、控制台
 """
 import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 from datetime import datetime
 from dotenv import load_dotenv
+from src.utils import json_utils
+from src.utils.cache import TTLCache
 
 # 加载环境变量
 load_dotenv()
 
+# 控制台告警分隔线
+SEPARATOR = "=" * 70
+NL_SEPARATOR = "\n" + SEPARATOR
+
+# 告警队列的结束标记
+_STOP = object()
+
+# 飞书卡片的固定元素，各张卡片共用同一份（只读，不要修改）
+_HR = {"tag": "hr"}
+_RISK_FOOTER = {
+    "tag": "note",
+    "elements": [
+        {
+            "tag": "plain_text",
+            "content": "⚠️ 风险提示: 仅供参考，请谨慎决策"
+        }
+    ]
+}
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+# 飞书卡片最多展示的AI分析字符数（卡片有长度限制）
+FEISHU_ANALYSIS_MAX_CHARS = 3000
+
+# AI分析文本转飞书Markdown用到的正则
+_EQUALS_RE = re.compile(r'={3,}')
+_HEADING_RE = re.compile(r'^#{2,3} (.+)$', re.MULTILINE)
+_DASH_LINE_RE = re.compile(r'^---+$', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def _build_card(title: str, template: str, elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """按固定骨架构建飞书卡片消息，只填入标题、颜色和元素"""
+    return {
+        "msg_type": "interactive",
+        "card": {
+            "header": {
+                "title": {
+                    "tag": "plain_text",
+                    "content": title
+                },
+                "template": template
+            },
+            "elements": elements
+        }
+    }
+
+
+def _md_div(content: str) -> Dict[str, Any]:
+    """单段 Markdown 文本元素"""
+    return {"tag": "div", "text": {"tag": "lark_md", "content": content}}
+
+
+def _md_fields(*contents: str) -> Dict[str, Any]:
+    """并排显示的 Markdown 字段元素（每个字段占半行）"""
+    return {
+        "tag": "div",
+        "fields": [
+            {"is_short": True, "text": {"tag": "lark_md", "content": content}}
+            for content in contents
+        ]
+    }
+
+
+# AI交易策略小标题
+_AI_STRATEGY_TITLE = _md_div("**📊 AI交易策略**")
+
+
+class _TokenBucket:
+    """令牌桶限流器：最多积攒 capacity 个令牌，每秒补充 rate 个"""
+
+    def __init__(self, capacity: int = 5, rate: float = 1.0):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """取一个令牌，没有可用令牌时等待补充"""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time.sleep((1 - self._tokens) / self.rate)
+
 
 class AlertManager:
     """告警管理器"""
@@ -23,6 +121,53 @@ class AlertManager:
         
         # 从环境变量加载配置
         self._load_config()
+
+        # 告警去重：有效期内内容相同的告警不再重复发送
+        self._dedup = TTLCache(maxsize=512, ttl=self.alert_dedup_ttl)
+
+        # 复用同一个会话，连续告警共用 keep-alive 连接，省去重复的 TCP/TLS 握手
+        self._session = self._create_session()
+
+        # 飞书消息由后台线程发送：窗口期内的告警合并为一张卡片，并经令牌桶限制发送频率
+        self._bucket = _TokenBucket(capacity=5, rate=1.0)
+        self._queue: queue.Queue = queue.Queue()
+        self._flush_thread = None
+        if self.feishu_enabled:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="feishu-flusher", daemon=True
+            )
+            self._flush_thread.start()
+
+        # 每日报告等其他飞书请求在后台线程发送，调用方不等待网络往返
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="alert-io")
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """创建带连接池和失败重试的 HTTP 会话"""
+        # webhook POST 不是幂等的：只重试请求肯定未被处理的情况（连接失败、限流、服务不可用），
+        # 读取超时等请求可能已送达的错误不重试，避免重复推送同一条告警
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            other=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 503],
+            allowed_methods=["POST"],
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """发送完队列中剩余的飞书告警和报告，然后关闭 HTTP 会话"""
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            self._queue.put(_STOP)
+            self._flush_thread.join()
+        self._io_pool.shutdown(wait=True)
+        self._session.close()
     
     def _load_config(self):
         """加载告警配置"""
@@ -32,6 +177,13 @@ class AlertManager:
         if self.feishu_webhook:
             self.feishu_enabled = True
             logger.info("飞书告警已启用")
+
+        # 飞书告警合并窗口（秒）与单张卡片最多合并的告警数
+        self.feishu_batch_window = float(os.getenv('FEISHU_BATCH_WINDOW', '5'))
+        self.feishu_batch_size = int(os.getenv('FEISHU_BATCH_SIZE', '20'))
+
+        # 相同告警的去重有效期（秒），0 表示不去重
+        self.alert_dedup_ttl = float(os.getenv('ALERT_DEDUP_TTL', '900'))
         
         # 邮件配置（预留）
         self.email_enabled = False
@@ -45,239 +197,210 @@ class AlertManager:
             analysis_result: 分析结果（结构化数据）
             full_analysis: AI完整分析文本（可选）
         """
+        # 交易对、趋势、信心度和触发信号都未变化时视为重复告警。
+        # 入队时先记录，避免排队期间的相同告警重复发送；飞书发送失败时再撤销记录
+        if self.alert_dedup_ttl > 0:
+            if not self._dedup.add(self._dedup_key(symbol, analysis_result)):
+                logger.info(f"{symbol} 告警与最近一次相同，跳过发送")
+                return
+
         # 控制台输出
         self._console_alert(symbol, analysis_result)
         
-        # 飞书通知
+        # 飞书通知（放入队列由后台线程合并发送，不阻塞调用方）
         if self.feishu_enabled:
-            self._send_feishu(symbol, analysis_result, full_analysis)
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._queue.put((symbol, analysis_result, full_analysis, timestamp))
         
         # 邮件通知（预留）
         if self.email_enabled:
             self._send_email(symbol, analysis_result)
     
-    def send_trading_alert(self, symbol: str, analysis_result: Dict[str, Any], formatted_output: str = ""):
-        """
-        发送交易告警（兼容旧接口）
-        
-        Args:
-            symbol: 交易对
-            analysis_result: 分析结果
-            formatted_output: 格式化输出（可选）
-        """
-        self.send_alert(symbol, analysis_result)
-    
+    # 兼容旧接口
+    send_trading_alert = send_alert
+
+    @staticmethod
+    def _dedup_key(symbol: str, analysis_result: Dict[str, Any]) -> Tuple:
+        """告警去重键"""
+        return (
+            symbol,
+            analysis_result.get('trend_direction'),
+            round(analysis_result.get('confidence') or 0, 1),
+            tuple(analysis_result.get('triggered_signals') or ()),
+        )
+
     def _console_alert(self, symbol: str, result: Dict[str, Any]):
         """控制台告警"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        logger.info("\n" + "=" * 70)
-        logger.info(f"🚨 交易信号提醒 - {symbol} - {timestamp}")
-        logger.info(f"当前价格: {result.get('current_price', 'N/A')}")
-        logger.info(f"24h涨跌: {result.get('price_change_24h', 0):.2f}%")
-        logger.info(f"趋势判断: {result.get('trend_direction', '未知')}")
-        logger.info(f"信心度: {result.get('confidence', 0)*100:.0f}%")
-        logger.info("=" * 70)
+        logger.info(NL_SEPARATOR)
+        logger.info("🚨 交易信号提醒 - {} - {}", symbol, timestamp)
+        logger.info("当前价格: {}", result.get('current_price', 'N/A'))
+        logger.info("24h涨跌: {:.2f}%", result.get('price_change_24h', 0))
+        logger.info("趋势判断: {}", result.get('trend_direction', '未知'))
+        logger.info("信心度: {:.0f}%", result.get('confidence', 0) * 100)
+        logger.info(SEPARATOR)
     
-    def _send_feishu(self, symbol: str, result: Dict[str, Any], full_analysis: str = ""):
+    def _flush_loop(self):
         """
-        发送飞书消息
-        
+        飞书告警发送线程
+
+        取到一条告警后，在合并窗口内继续收集后续告警（最多 feishu_batch_size 条），
+        合成一张卡片发送；收到结束标记时立即发送已收集的告警并退出。
+        """
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.feishu_batch_window
+            while len(batch) < self.feishu_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._send_feishu(batch)
+
+    def _send_feishu(self, alerts: List[Tuple[str, Dict[str, Any], str, str]]):
+        """
+        发送飞书消息，多条告警合并为一张卡片
+
         Args:
-            symbol: 交易对
-            result: 分析结果
+            alerts: 告警列表，每项为 (交易对, 分析结果, AI完整分析, 时间)
         """
+        sent = False
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # 提取关键信息
-            current_price = result.get('current_price', 'N/A')
-            price_change = result.get('price_change_24h', 0)
-            trend = result.get('trend_direction', '未知')
-            confidence = result.get('confidence', 0)
-            signals = result.get('triggered_signals', [])
-            
-            # 构建飞书卡片消息
-            card = {
-                "msg_type": "interactive",
-                "card": {
-                    "header": {
-                        "title": {
-                            "tag": "plain_text",
-                            "content": f"🚨 交易信号提醒 - {symbol}"
-                        },
-                        "template": "red"
-                    },
-                    "elements": [
-                        {
-                            "tag": "div",
-                            "text": {
-                                "tag": "lark_md",
-                                "content": f"**⏰ 时间**: {timestamp}"
-                            }
-                        },
-                        {
-                            "tag": "hr"
-                        },
-                        {
-                            "tag": "div",
-                            "fields": [
-                                {
-                                    "is_short": True,
-                                    "text": {
-                                        "tag": "lark_md",
-                                        "content": f"**💰 当前价格**\n{current_price}"
-                                    }
-                                },
-                                {
-                                    "is_short": True,
-                                    "text": {
-                                        "tag": "lark_md",
-                                        "content": f"**📈 24h涨跌**\n{price_change:.2f}%"
-                                    }
-                                }
-                            ]
-                        },
-                        {
-                            "tag": "div",
-                            "fields": [
-                                {
-                                    "is_short": True,
-                                    "text": {
-                                        "tag": "lark_md",
-                                        "content": f"**🎯 趋势判断**\n{trend}"
-                                    }
-                                },
-                                {
-                                    "is_short": True,
-                                    "text": {
-                                        "tag": "lark_md",
-                                        "content": f"**💪 信心度**\n{confidence*100:.0f}%"
-                                    }
-                                }
-                            ]
-                        }
-                    ]
-                }
-            }
-            
-            # 添加触发信号
-            if signals:
-                signals_text = "**⚡ 触发信号**\n"
-                for signal in signals:
-                    signals_text += f"• {signal}\n"
-                
-                card["card"]["elements"].append({
-                    "tag": "hr"
-                })
-                card["card"]["elements"].append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": signals_text
-                    }
-                })
-            
-            # 添加交易建议
-            if result.get('suggested_position') or result.get('stop_loss') or result.get('target_price'):
-                card["card"]["elements"].append({
-                    "tag": "hr"
-                })
-                
-                advice_fields = []
-                if result.get('suggested_position'):
-                    advice_fields.append({
-                        "is_short": True,
-                        "text": {
-                            "tag": "lark_md",
-                            "content": f"**💡 建议仓位**\n{result.get('suggested_position')}"
-                        }
-                    })
-                
-                if result.get('stop_loss'):
-                    advice_fields.append({
-                        "is_short": True,
-                        "text": {
-                            "tag": "lark_md",
-                            "content": f"**🛑 止损位**\n{result.get('stop_loss')}"
-                        }
-                    })
-                
-                if result.get('target_price'):
-                    advice_fields.append({
-                        "is_short": True,
-                        "text": {
-                            "tag": "lark_md",
-                            "content": f"**🎯 目标位**\n{result.get('target_price')}"
-                        }
-                    })
-                
-                if advice_fields:
-                    card["card"]["elements"].append({
-                        "tag": "div",
-                        "fields": advice_fields
-                    })
-            
-            # 添加AI完整分析（如果有）
-            if full_analysis:
-                card["card"]["elements"].append({
-                    "tag": "hr"
-                })
-                card["card"]["elements"].append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": "**📊 AI交易策略**"
-                    }
-                })
-
-                # 清理和格式化分析文本
-                analysis_text = self._format_analysis_for_feishu(full_analysis)
-
-                # 截取分析文本（飞书卡片有长度限制，最多3000字符）
-                if len(analysis_text) > 3000:
-                    analysis_text = analysis_text[:3000] + "\n\n...(内容过长，已截断)"
-
-                card["card"]["elements"].append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": analysis_text
-                    }
-                })
-            
-            # 添加风险提示
-            card["card"]["elements"].append({
-                "tag": "hr"
-            })
-            card["card"]["elements"].append({
-                "tag": "note",
-                "elements": [
-                    {
-                        "tag": "plain_text",
-                        "content": "⚠️ 风险提示: 仅供参考，请谨慎决策"
-                    }
-                ]
-            })
-            
-            # 发送请求
-            response = requests.post(
-                self.feishu_webhook,
-                json=card,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                result_data = response.json()
-                if result_data.get('code') == 0:
-                    logger.info("飞书消息发送成功")
-                else:
-                    logger.error(f"飞书消息发送失败: {result_data}")
+            if len(alerts) == 1:
+                symbol, result, full_analysis, timestamp = alerts[0]
+                title = f"🚨 交易信号提醒 - {symbol}"
+                elements = self._build_alert_elements(result, full_analysis, timestamp)
             else:
-                logger.error(f"飞书消息发送失败: HTTP {response.status_code}")
-        
+                symbols = ", ".join(dict.fromkeys(alert[0] for alert in alerts))
+                title = f"🚨 交易信号提醒 - {len(alerts)} 条 ({symbols})"
+                elements = []
+                for symbol, result, full_analysis, timestamp in alerts:
+                    if elements:
+                        elements.append(_HR)
+                    elements.append(_md_div(f"**🚨 {symbol}**"))
+                    elements.extend(self._build_alert_elements(result, full_analysis, timestamp))
+
+            # 添加风险提示
+            elements.append(_HR)
+            elements.append(_RISK_FOOTER)
+
+            # 构建飞书卡片消息
+            card = _build_card(title, "red", elements)
+
+            sent = self._post_card(card, "飞书消息")
+            if sent:
+                logger.info(f"飞书消息发送成功（{len(alerts)} 条告警）")
+
         except Exception as e:
             logger.error(f"发送飞书消息时出错: {e}")
 
+        # 发送失败时撤销这些告警的去重记录，之后相同的告警仍会发送
+        if not sent:
+            for symbol, result, _, _ in alerts:
+                self._dedup.pop(self._dedup_key(symbol, result))
+
+    def _build_alert_elements(self, result: Dict[str, Any], full_analysis: str, timestamp: str) -> List[Dict[str, Any]]:
+        """
+        构建单条告警的卡片元素（不含风险提示）
+
+        Args:
+            result: 分析结果
+            full_analysis: AI完整分析文本
+            timestamp: 告警时间
+
+        Returns:
+            卡片元素列表
+        """
+        # 提取关键信息
+        current_price = result.get('current_price', 'N/A')
+        price_change = result.get('price_change_24h', 0)
+        trend = result.get('trend_direction', '未知')
+        confidence = result.get('confidence', 0)
+        signals = result.get('triggered_signals', [])
+
+        elements = [
+            _md_div(f"**⏰ 时间**: {timestamp}"),
+            _HR,
+            _md_fields(f"**💰 当前价格**\n{current_price}", f"**📈 24h涨跌**\n{price_change:.2f}%"),
+            _md_fields(f"**🎯 趋势判断**\n{trend}", f"**💪 信心度**\n{confidence*100:.0f}%"),
+        ]
+
+        # 添加触发信号
+        if signals:
+            signals_text = "**⚡ 触发信号**\n" + "".join(f"• {signal}\n" for signal in signals)
+            elements.append(_HR)
+            elements.append(_md_div(signals_text))
+
+        # 添加交易建议
+        advice = []
+        if result.get('suggested_position'):
+            advice.append(f"**💡 建议仓位**\n{result.get('suggested_position')}")
+        if result.get('stop_loss'):
+            advice.append(f"**🛑 止损位**\n{result.get('stop_loss')}")
+        if result.get('target_price'):
+            advice.append(f"**🎯 目标位**\n{result.get('target_price')}")
+        if advice:
+            elements.append(_HR)
+            elements.append(_md_fields(*advice))
+
+        # 添加AI完整分析（如果有）
+        if full_analysis:
+            # 清理和格式化分析文本
+            analysis_text = self._format_analysis_for_feishu(full_analysis)
+
+            # 截取分析文本（飞书卡片有长度限制，最多3000字符）
+            if len(analysis_text) > FEISHU_ANALYSIS_MAX_CHARS:
+                analysis_text = analysis_text[:FEISHU_ANALYSIS_MAX_CHARS] + "\n\n...(内容过长，已截断)"
+
+            elements.append(_HR)
+            elements.append(_AI_STRATEGY_TITLE)
+            elements.append(_md_div(analysis_text))
+
+        return elements
+
+    def _post_card(self, card: Dict[str, Any], name: str) -> bool:
+        """
+        发送飞书卡片（经令牌桶限流，避免触发 webhook 频率限制）
+
+        Args:
+            card: 卡片消息
+            name: 消息名称，用于日志
+
+        Returns:
+            bool: 是否发送成功
+        """
+        self._bucket.acquire()
+        response = self._session.post(
+            self.feishu_webhook,
+            data=json_utils.dumps(card),
+            headers=_JSON_HEADERS,
+            timeout=10
+        )
+
+        if response.status_code != 200:
+            logger.error(f"{name}发送失败: HTTP {response.status_code}")
+            return False
+
+        result_data = json_utils.loads(response.content)
+        if result_data.get('code') != 0:
+            logger.error(f"{name}发送失败: {result_data}")
+            return False
+
+        return True
+
     def _format_analysis_for_feishu(self, analysis_text: str) -> str:
         """
         格式化AI分析文本以适配飞书Markdown
@@ -288,31 +411,24 @@ class AlertManager:
         Returns:
             格式化后的文本
         """
-        import re
-
-        # 移除市场数据摘要部分（已经在卡片中单独显示）
-        if "【市场数据摘要】" in analysis_text:
-            parts = analysis_text.split("【市场数据摘要】", 1)
-            if len(parts) > 1:
-                # 找到摘要结束的位置（下一个分隔线）
-                remaining = parts[1]
-                if "\n\n" in remaining:
-                    analysis_text = remaining.split("\n\n", 1)[1] if len(remaining.split("\n\n", 1)) > 1 else remaining
+        # 移除市场数据摘要部分（已经在卡片中单独显示，摘要到下一个空行为止）
+        _, marker, remaining = analysis_text.partition("【市场数据摘要】")
+        if marker:
+            _, blank, rest = remaining.partition("\n\n")
+            if blank:
+                analysis_text = rest
 
         # 移除等号分隔线
-        analysis_text = re.sub(r'={3,}', '', analysis_text)
+        analysis_text = _EQUALS_RE.sub('', analysis_text)
 
-        # 将 ## 标题转换为 **粗体**
-        analysis_text = re.sub(r'^## (.+)$', r'**\1**', analysis_text, flags=re.MULTILINE)
-
-        # 将 ### 标题转换为 **粗体**
-        analysis_text = re.sub(r'^### (.+)$', r'**\1**', analysis_text, flags=re.MULTILINE)
+        # 将 ## / ### 标题转换为 **粗体**
+        analysis_text = _HEADING_RE.sub(r'**\1**', analysis_text)
 
         # 移除 --- 分隔线
-        analysis_text = re.sub(r'^---+$', '', analysis_text, flags=re.MULTILINE)
+        analysis_text = _DASH_LINE_RE.sub('', analysis_text)
 
         # 清理多余的空行（超过2个连续空行）
-        analysis_text = re.sub(r'\n{3,}', '\n\n', analysis_text)
+        analysis_text = _BLANK_LINES_RE.sub('\n\n', analysis_text)
 
         # 移除开头和结尾的空白
         analysis_text = analysis_text.strip()
@@ -338,9 +454,10 @@ class AlertManager:
             statistics: 统计数据
         """
         if self.feishu_enabled:
-            self._send_feishu_report(statistics)
-        
-        logger.info("每日报告已发送")
+            self._io_pool.submit(self._send_feishu_report, statistics)
+            logger.info("每日报告已加入发送队列")
+        else:
+            logger.info("每日报告已发送")
     
     def _send_feishu_report(self, stats: Dict[str, Any]):
         """发送飞书每日报告"""
@@ -348,87 +465,33 @@ class AlertManager:
             timestamp = datetime.now().strftime('%Y-%m-%d')
             
             # 构建飞书卡片
-            card = {
-                "msg_type": "interactive",
-                "card": {
-                    "header": {
-                        "title": {
-                            "tag": "plain_text",
-                            "content": f"📊 每日交易报告 - {timestamp}"
-                        },
-                        "template": "blue"
-                    },
-                    "elements": [
-                        {
-                            "tag": "div",
-                            "fields": [
-                                {
-                                    "is_short": True,
-                                    "text": {
-                                        "tag": "lark_md",
-                                        "content": f"**总分析次数**\n{stats.get('total_analyses', 0)}"
-                                    }
-                                },
-                                {
-                                    "is_short": True,
-                                    "text": {
-                                        "tag": "lark_md",
-                                        "content": f"**交易机会**\n{stats.get('opportunity_count', 0)}"
-                                    }
-                                }
-                            ]
-                        },
-                        {
-                            "tag": "div",
-                            "text": {
-                                "tag": "lark_md",
-                                "content": f"**机会率**: {stats.get('opportunity_rate', 0)*100:.1f}%"
-                            }
-                        }
-                    ]
-                }
-            }
+            elements = [
+                _md_fields(
+                    f"**总分析次数**\n{stats.get('total_analyses', 0)}",
+                    f"**交易机会**\n{stats.get('opportunity_count', 0)}",
+                ),
+                _md_div(f"**机会率**: {stats.get('opportunity_rate', 0)*100:.1f}%"),
+            ]
             
             # 添加趋势分布
             trend_dist = stats.get('trend_distribution', {})
             if trend_dist:
-                trend_text = "**🎯 趋势分布**\n"
-                for trend, count in trend_dist.items():
-                    trend_text += f"• {trend}: {count}次\n"
-                
-                card["card"]["elements"].append({
-                    "tag": "hr"
-                })
-                card["card"]["elements"].append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": trend_text
-                    }
-                })
+                trend_text = "**🎯 趋势分布**\n" + "".join(
+                    f"• {trend}: {count}次\n" for trend, count in trend_dist.items()
+                )
+                elements.append(_HR)
+                elements.append(_md_div(trend_text))
             
             # 添加平均信心度
             avg_conf = stats.get('avg_confidence', 0)
             if avg_conf:
-                card["card"]["elements"].append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": f"**💪 平均信心度**: {avg_conf*100:.0f}%"
-                    }
-                })
+                elements.append(_md_div(f"**💪 平均信心度**: {avg_conf*100:.0f}%"))
             
-            # 发送请求
-            response = requests.post(
-                self.feishu_webhook,
-                json=card,
-                timeout=10
-            )
+            card = _build_card(f"📊 每日交易报告 - {timestamp}", "blue", elements)
             
-            if response.status_code == 200:
+            # 发送请求
+            if self._post_card(card, "飞书每日报告"):
                 logger.info("飞书每日报告发送成功")
-            else:
-                logger.error(f"飞书每日报告发送失败: HTTP {response.status_code}")
         
         except Exception as e:
             logger.error(f"发送飞书每日报告时出错: {e}")
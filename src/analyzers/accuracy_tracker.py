@@ -8,6 +8,10 @@ from loguru import logger
 from src.database import AnalysisRepository
 from src.data_collectors.kline_volume import KlineVolumeCollector
 
+# 趋势方向取值（兼容旧记录的“上涨/下跌”与AI输出的“看多/看空”）
+_LONG_TRENDS = ('上涨', '看多')
+_SHORT_TRENDS = ('下跌', '看空')
+
 
 class AccuracyTracker:
     """信号准确率追踪器"""
@@ -34,11 +38,9 @@ class AccuracyTracker:
             # 获取需要更新的信号记录
             cutoff_time = datetime.now() - timedelta(hours=hours)
             
-            with self.repo.db as conn:
-                cursor = conn.cursor()
-                
-                # 查询未更新的信号记录
-                cursor.execute("""
+            # 查询未更新的信号记录（只读连接，不占用写锁）
+            with self.repo.read_db as conn:
+                pending_signals = conn.execute("""
                     SELECT sp.id, sp.analysis_id, sp.symbol, sp.entry_price, sp.entry_time,
                            ar.trend_direction, ar.target_price, ar.stop_loss
                     FROM signal_performance sp
@@ -47,97 +49,97 @@ class AccuracyTracker:
                     AND sp.entry_time >= ?
                     AND sp.exit_price IS NULL
                     ORDER BY sp.entry_time DESC
-                """, (symbol, cutoff_time))
-                
-                pending_signals = cursor.fetchall()
+                """, (symbol, cutoff_time)).fetchall()
 
-                if not pending_signals:
-                    logger.info(f"没有需要更新的信号记录: {symbol}")
-                    return updated_count
+            if not pending_signals:
+                logger.info(f"没有需要更新的信号记录: {symbol}")
+                return updated_count
+            
+            logger.info(f"找到 {len(pending_signals)} 条待更新的信号记录")
+            
+            # 获取当前价格（网络请求，在写事务之外完成）
+            current_data = self.kline_collector.collect(symbol)
+            current_price = current_data.get('current_price')
+
+            if not current_price:
+                logger.warning("无法获取当前价格")
+                return updated_count
+            
+            # 计算每条记录的表现，需要关闭的信号最后在一个写事务中更新
+            closed_signals = []
+            for signal in pending_signals:
+                signal_id = signal['id']
+                entry_price = signal['entry_price']
+                entry_time = datetime.fromisoformat(signal['entry_time'])
+                trend = signal['trend_direction']
+                target_price = signal['target_price']
+                stop_loss = signal['stop_loss']
                 
-                logger.info(f"找到 {len(pending_signals)} 条待更新的信号记录")
+                # 计算价格变化
+                price_change_pct = ((current_price - entry_price) / entry_price) * 100
                 
-                # 获取当前价格
-                current_data = self.kline_collector.collect(symbol)
-                current_price = current_data.get('current_price')
-
-                if not current_price:
-                    logger.warning("无法获取当前价格")
-                    return updated_count
+                # 判断是否达到目标或止损
+                hit_target = False
+                hit_stop_loss = False
+                is_profitable = False
                 
-                # 更新每条记录
-                for signal in pending_signals:
-                    signal_id = signal['id']
-                    entry_price = signal['entry_price']
-                    entry_time = datetime.fromisoformat(signal['entry_time'])
-                    trend = signal['trend_direction']
-                    target_price = signal['target_price']
-                    stop_loss = signal['stop_loss']
-                    
-                    # 计算价格变化
-                    price_change_pct = ((current_price - entry_price) / entry_price) * 100
-                    
-                    # 判断是否达到目标或止损
-                    hit_target = False
-                    hit_stop_loss = False
-                    is_profitable = False
-                    
-                    if trend == '上涨' or trend == '看多':
-                        # 做多信号
-                        if target_price and current_price >= target_price:
-                            hit_target = True
-                            is_profitable = True
-                        elif stop_loss and current_price <= stop_loss:
-                            hit_stop_loss = True
-                            is_profitable = False
-                        else:
-                            is_profitable = price_change_pct > 0
-                    
-                    elif trend == '下跌' or trend == '看空':
-                        # 做空信号
-                        if target_price and current_price <= target_price:
-                            hit_target = True
-                            is_profitable = True
-                        elif stop_loss and current_price >= stop_loss:
-                            hit_stop_loss = True
-                            is_profitable = False
-                        else:
-                            is_profitable = price_change_pct < 0
-                    
-                    # 检查是否应该关闭信号（达到目标、止损或超过24小时）
-                    hours_elapsed = (datetime.now() - entry_time).total_seconds() / 3600
-                    should_close = hit_target or hit_stop_loss or hours_elapsed >= 24
-                    
-                    if should_close:
-                        # 更新记录
-                        cursor.execute("""
-                            UPDATE signal_performance
-                            SET exit_price = ?,
-                                exit_time = ?,
-                                price_change_pct = ?,
-                                hit_target = ?,
-                                hit_stop_loss = ?,
-                                is_profitable = ?
-                            WHERE id = ?
-                        """, (
-                            current_price,
-                            datetime.now(),
-                            price_change_pct,
-                            1 if hit_target else 0,
-                            1 if hit_stop_loss else 0,
-                            1 if is_profitable else 0,
-                            signal_id
-                        ))
-
-                        updated_count += 1  # 增加计数
+                if trend in _LONG_TRENDS:
+                    # 做多信号
+                    if target_price and current_price >= target_price:
+                        hit_target = True
+                        is_profitable = True
+                    elif stop_loss and current_price <= stop_loss:
+                        hit_stop_loss = True
+                        is_profitable = False
+                    else:
+                        is_profitable = price_change_pct > 0
+                
+                elif trend in _SHORT_TRENDS:
+                    # 做空信号
+                    if target_price and current_price <= target_price:
+                        hit_target = True
+                        is_profitable = True
+                    elif stop_loss and current_price >= stop_loss:
+                        hit_stop_loss = True
+                        is_profitable = False
+                    else:
+                        is_profitable = price_change_pct < 0
+                
+                # 检查是否应该关闭信号（达到目标、止损或超过24小时）
+                hours_elapsed = (datetime.now() - entry_time).total_seconds() / 3600
+                should_close = hit_target or hit_stop_loss or hours_elapsed >= 24
+                
+                if should_close:
+                    closed_signals.append((
+                        current_price,
+                        datetime.now(),
+                        price_change_pct,
+                        1 if hit_target else 0,
+                        1 if hit_stop_loss else 0,
+                        1 if is_profitable else 0,
+                        signal_id
+                    ))
+                    logger.info(f"信号 {signal_id} 已关闭: "
+                              f"{'盈利' if is_profitable else '亏损'}, "
+                              f"价格变化: {price_change_pct:.2f}%")
 
-                        logger.info(f"信号 {signal_id} 已关闭: "
-                                  f"{'盈利' if is_profitable else '亏损'}, "
-                                  f"价格变化: {price_change_pct:.2f}%")
+            if closed_signals:
+                # 查询后可能已有其他任务关闭了信号，只更新仍未关闭的记录
+                with self.repo.db as conn:
+                    cursor = conn.executemany("""
+                        UPDATE signal_performance
+                        SET exit_price = ?,
+                            exit_time = ?,
+                            price_change_pct = ?,
+                            hit_target = ?,
+                            hit_stop_loss = ?,
+                            is_profitable = ?
+                        WHERE id = ? AND exit_price IS NULL
+                    """, closed_signals)
+                    updated_count = cursor.rowcount
 
-                conn.commit()
-                logger.info(f"信号表现更新完成: {symbol}, 更新了 {updated_count} 条记录")
-                return updated_count  # 返回更新计数
+            logger.info(f"信号表现更新完成: {symbol}, 更新了 {updated_count} 条记录")
+            return updated_count  # 返回更新计数
 
         except Exception as e:
             logger.error(f"更新信号表现失败: {e}", exc_info=True)
@@ -157,7 +159,7 @@ class AccuracyTracker:
         try:
             cutoff_time = datetime.now() - timedelta(days=days)
             
-            with self.repo.db as conn:
+            with self.repo.read_db as conn:
                 cursor = conn.cursor()
                 
                 # 总信号数
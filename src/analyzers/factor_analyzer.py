@@ -72,16 +72,23 @@ class FactorAnalyzer:
 - 社交情绪: {ns['social_sentiment'].get('sentiment', 'neutral')}
 """
 
+        # 各部分收集到列表中最后一次拼接，避免反复 += 复制整段文本
+        parts = [formatted_text]
+
         # 添加最新新闻标题
         if ns['crypto_news']['news_list']:
-            formatted_text += "\n【最新相关新闻】\n"
-            for i, news in enumerate(ns['crypto_news']['news_list'][:3], 1):
-                formatted_text += f"  {i}. [{news['sentiment']}] {news['title']}\n"
+            parts.append("\n【最新相关新闻】\n")
+            parts.extend(
+                f"  {i}. [{news['sentiment']}] {news['title']}\n"
+                for i, news in enumerate(ns['crypto_news']['news_list'][:3], 1)
+            )
 
         # 添加宏观新闻
         if ns['macro_news']['news_list']:
-            formatted_text += "\n【宏观财经新闻】\n"
-            for i, news in enumerate(ns['macro_news']['news_list'][:2], 1):
-                formatted_text += f"  {i}. {news['title']}\n"
+            parts.append("\n【宏观财经新闻】\n")
+            parts.extend(
+                f"  {i}. {news['title']}\n"
+                for i, news in enumerate(ns['macro_news']['news_list'][:2], 1)
+            )
 
-        return formatted_text
+        return "".join(parts)
@@ -11,8 +11,8 @@ class MarketSignalDetector:
     """市场信号检测器 - 预判是否有交易机会"""
 
     def __init__(self):
+        # 检测器不保存单次检测的状态，可在多次分析、多个线程间共享
         self.enabled = settings.MARKET_SIGNAL_DETECTION_ENABLED
-        self.signals = []
 
     def detect_trading_opportunity(
         self,
@@ -37,43 +37,43 @@ class MarketSignalDetector:
             logger.info("行情预判功能已禁用，将进行AI分析")
             return True, ["预判功能已禁用"], {}
 
-        self.signals = []
+        signals = []
         signal_details = {}
 
         # 1. 检查资金费率信号
         funding_signal = self._check_funding_rate_signal(funding_rate)
         if funding_signal:
-            self.signals.append(funding_signal["type"])
+            signals.append(funding_signal["type"])
             signal_details["funding_rate"] = funding_signal
 
         # 2. 检查价格波动信号
         price_signal = self._check_price_volatility_signal(kline_volume)
         if price_signal:
-            self.signals.append(price_signal["type"])
+            signals.append(price_signal["type"])
             signal_details["price_volatility"] = price_signal
 
         # 3. 检查成交量异常信号
         volume_signal = self._check_volume_anomaly_signal(kline_volume)
         if volume_signal:
-            self.signals.append(volume_signal["type"])
+            signals.append(volume_signal["type"])
             signal_details["volume_anomaly"] = volume_signal
 
         # 4. 检查爆仓信号
         liquidation_signal = self._check_liquidation_signal(liquidation)
         if liquidation_signal:
-            self.signals.append(liquidation_signal["type"])
+            signals.append(liquidation_signal["type"])
             signal_details["liquidation"] = liquidation_signal
 
         # 5. 检查消息面信号
         news_signal = self._check_news_sentiment_signal(news_sentiment)
         if news_signal:
-            self.signals.append(news_signal["type"])
+            signals.append(news_signal["type"])
             signal_details["news_sentiment"] = news_signal
 
         # 判断是否有交易机会
-        has_opportunity = len(self.signals) >= settings.MIN_SIGNAL_COUNT
+        has_opportunity = len(signals) >= settings.MIN_SIGNAL_COUNT
 
-        return has_opportunity, self.signals, signal_details
+        return has_opportunity, signals, signal_details
 
     def _check_funding_rate_signal(
         self, funding_rate: Dict[str, Any]
@@ -276,8 +276,9 @@ class MarketSignalDetector:
         if not has_opportunity:
             return f"未检测到明显交易机会（触发信号数：{len(signals)}/{settings.MIN_SIGNAL_COUNT}）"
 
-        summary = f"检测到交易机会！触发 {len(signals)} 个信号：\n"
-        for signal_type, details in signal_details.items():
-            summary += f"  • [{details['strength']}] {details['type']}: {details['description']}\n"
-
-        return summary.strip()
+        lines = [f"检测到交易机会！触发 {len(signals)} 个信号："]
+        lines.extend(
+            f"  • [{details['strength']}] {details['type']}: {details['description']}"
+            for details in signal_details.values()
+        )
+        return "\n".join(lines)
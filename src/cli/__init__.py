@@ -6,6 +6,7 @@ from .query_commands import (
     show_accuracy_report
 )
 from .accuracy_commands import update_signal_performance
+from .parser import build_parser
 
 __all__ = [
     'show_history',
@@ -13,4 +14,5 @@ __all__ = [
     'export_data',
     'show_accuracy_report',
     'update_signal_performance',
+    'build_parser',
 ]
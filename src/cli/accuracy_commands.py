@@ -3,7 +3,6 @@
 包含信号表现更新功能
 """
 from loguru import logger
-from src.analyzers.accuracy_tracker import AccuracyTracker
 
 
 def update_signal_performance(symbol: str):
@@ -14,6 +13,8 @@ def update_signal_performance(symbol: str):
         symbol: 交易对
     """
     try:
+        from src.analyzers.accuracy_tracker import AccuracyTracker
+
         tracker = AccuracyTracker()
         
         print(f"\n🔄 正在更新 {symbol} 的信号表现...")
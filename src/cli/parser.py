@@ -0,0 +1,93 @@
+﻿"""
+命令行参数解析模块
+所有入口共用的参数定义
+"""
+import argparse
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """构建命令行参数解析器"""
+    parser = argparse.ArgumentParser(
+        description="加密货币交易智能体 - 自动监控与信号追踪",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  启动监控:
+    python src/main.py --symbol BTCUSDT
+    python src/main.py --symbol ETHUSDT --interval 15
+    python src/main.py --symbol BTCUSDT --interval 5 --verbose
+
+  数据查询:
+    python src/main.py --history BTCUSDT --days 7 --limit 10
+    python src/main.py --stats BTCUSDT --days 30
+    python src/main.py --export BTCUSDT
+
+  准确率追踪:
+    python src/main.py --accuracy BTCUSDT --days 30
+        """
+    )
+
+    # 监控参数
+    parser.add_argument(
+        "--symbol",
+        type=str,
+        help="监控的交易对（必填）",
+        required=False,
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=15,
+        help="监控间隔（分钟），默认15分钟",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="详细输出模式",
+    )
+
+    # 数据查询参数
+    parser.add_argument(
+        "--history",
+        type=str,
+        metavar="SYMBOL",
+        help="查询历史分析记录",
+    )
+    parser.add_argument(
+        "--stats",
+        type=str,
+        metavar="SYMBOL",
+        help="查看统计报告",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="查询天数，默认7天",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="查询记录数量，默认10条",
+    )
+    parser.add_argument(
+        "--export",
+        type=str,
+        metavar="SYMBOL",
+        help="导出数据到CSV文件",
+    )
+    parser.add_argument(
+        "--accuracy",
+        type=str,
+        metavar="SYMBOL",
+        help="查看信号准确率报告",
+    )
+    parser.add_argument(
+        "--update-signals",
+        type=str,
+        metavar="SYMBOL",
+        help="更新信号表现（追踪价格变化）",
+    )
+
+    return parser
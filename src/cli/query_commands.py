@@ -7,6 +7,11 @@ from pathlib import Path
 from loguru import logger
 from src.database import AnalysisRepository
 
+# 输出分隔线，模块加载时构造一次
+SEPARATOR = "=" * 80
+NL_SEPARATOR = "\n" + SEPARATOR
+DIVIDER = "-" * 80
+
 
 def _log_output(message: str, level: str = "info"):
     """同时输出到控制台和日志"""
@@ -32,9 +37,9 @@ def show_history(symbol: str, days: int, limit: int):
             _log_output(f"\n⚠️  没有找到 {symbol} 的历史记录", "warning")
             return
 
-        _log_output("\n" + "=" * 80)
+        _log_output(NL_SEPARATOR)
         _log_output(f"📊 {symbol} 历史分析记录（最近 {limit} 条）")
-        _log_output("=" * 80)
+        _log_output(SEPARATOR)
 
         for i, record in enumerate(records, 1):
             _log_output(f"\n【记录 {i}】")
@@ -56,7 +61,7 @@ def show_history(symbol: str, days: int, limit: int):
             if record['target_price']:
                 _log_output(f"目标位: ${record['target_price']:.2f}")
 
-            _log_output("-" * 80)
+            _log_output(DIVIDER)
 
         _log_output(f"\n✅ 共查询到 {len(records)} 条记录")
 
@@ -71,9 +76,9 @@ def show_statistics(symbol: str, days: int):
         repo = AnalysisRepository()
         stats = repo.get_signal_statistics(symbol, days=days)
 
-        _log_output("\n" + "=" * 80)
+        _log_output(NL_SEPARATOR)
         _log_output(f"📈 {symbol} 统计报告（最近 {days} 天）")
-        _log_output("=" * 80)
+        _log_output(SEPARATOR)
 
         _log_output(f"\n【基础统计】")
         _log_output(f"总分析次数: {stats['total_analyses']}")
@@ -102,7 +107,7 @@ def show_statistics(symbol: str, days: int):
         _log_output("\n【分析频率】")
         _log_output(f"平均每天分析: {stats['total_analyses'] / max(days, 1):.1f} 次")
 
-        _log_output("\n" + "=" * 80)
+        _log_output(NL_SEPARATOR)
 
     except Exception as e:
         logger.error(f"生成统计报告失败: {e}", exc_info=True)
@@ -174,9 +179,9 @@ def show_accuracy_report(symbol: str, days: int):
             _log_output("提示: 请先运行 --update-signals 更新信号表现")
             return
 
-        _log_output("\n" + "=" * 80)
+        _log_output(NL_SEPARATOR)
         _log_output(f"🎯 {symbol} 信号准确率报告（最近 {days} 天）")
-        _log_output("=" * 80)
+        _log_output(SEPARATOR)
 
         _log_output(f"\n【总体统计】")
         _log_output(f"总信号数: {report['total_signals']}")
@@ -199,7 +204,7 @@ def show_accuracy_report(symbol: str, days: int):
                 _log_output(f"  准确率: {perf['accuracy']*100:.1f}%")
                 _log_output(f"  平均收益: {perf['avg_profit']:.2f}%")
 
-        _log_output("\n" + "=" * 80)
+        _log_output(NL_SEPARATOR)
 
     except Exception as e:
         logger.error(f"生成准确率报告失败: {e}", exc_info=True)
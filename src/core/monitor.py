@@ -2,15 +2,26 @@
 监控模块 - 业务逻辑层
 负责单次分析的执行，不包含调度逻辑
 """
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 from loguru import logger
 
-from src.workflow import run_trading_analysis
+from src.workflow import arun_trading_analysis_batch, can_resume
 from src.database import AnalysisRepository
 from src.alerts import AlertManager
 from src.analyzers.accuracy_tracker import AccuracyTracker
 
+SEPARATOR = "=" * 70
+
+# 工作流中同步节点和采集请求使用的最大线程数
+MAX_WORKERS = 8
+# 同时运行的工作流数上限，避免并发请求触发交易所和 LLM 接口的频率限制
+MAX_CONCURRENT_ANALYSES = 4
+
 
 class TradingMonitor:
     """交易监控器 - 负责执行单次分析"""
@@ -22,6 +33,12 @@ class TradingMonitor:
         self.tracker = AccuracyTracker()
         self.analysis_count = 0
 
+        # 事件循环和线程池在多轮分析间复用（线程按需创建，不超过 MAX_WORKERS）。
+        # 线程池作为事件循环的默认执行器，工作流中的 to_thread 采集请求和同步节点都在其中执行
+        self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="monitor")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._pool)
+
     def analyze_symbol(self, symbol: str, verbose: bool = False) -> bool:
         """
         分析单个交易对
@@ -33,23 +50,101 @@ class TradingMonitor:
         Returns:
             bool: 是否分析成功
         """
-        self.analysis_count += 1
+        return self.analyze_symbols([symbol], verbose)[symbol]
 
-        logger.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 开始分析 {symbol} (第 {self.analysis_count} 次)")
+    def analyze_symbols(self, symbols: List[str], verbose: bool = False) -> Dict[str, bool]:
+        """
+        分析一组交易对，本轮所有结果在同一个数据库事务中保存
 
-        try:
-            # 运行分析
-            final_state = run_trading_analysis(symbol, verbose)
+        Args:
+            symbols: 交易对列表
+            verbose: 是否详细输出
 
-            if not final_state.get("analysis_result"):
-                logger.warning(f"{symbol} 分析失败")
-                return False
+        Returns:
+            Dict[str, bool]: 各交易对是否分析成功
+        """
+        t0 = time.perf_counter()
+        started_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        round_log = logger.bind(event="monitor_round", symbols=symbols, ts=started_at)
+        round_log.opt(lazy=True).info(
+            "本轮分析开始: {} 个交易对 ({})", lambda: len(symbols), lambda: ', '.join(symbols)
+        )
+
+        # 各交易对的工作流以网络 I/O 为主，在同一个事件循环中并发执行，本轮耗时取决于最慢的一个。
+        # 结果按传入顺序返回，按此顺序保存和输出
+        states = self._loop.run_until_complete(self._run_analyses(symbols, verbose, started_at))
+
+        # 保存到数据库（整轮只提交一次）
+        analysis_ids = {}
+        try:
+            with self.repo.transaction():
+                for symbol, final_state in states.items():
+                    if final_state is None:
+                        continue
+                    try:
+                        analysis_ids[symbol] = self.repo.save_analysis(
+                            symbol, final_state, final_state["analysis_result"]
+                        )
+                    except Exception as e:
+                        logger.error("保存 {} 分析结果时出错: {}", symbol, e, exc_info=True)
+        except Exception as e:
+            logger.error("保存分析结果时出错: {}", e, exc_info=True)
+            analysis_ids.clear()
+
+        results = {}
+        for symbol, final_state in states.items():
+            if symbol not in analysis_ids:
+                results[symbol] = False
+                continue
+            logger.info("分析结果已保存，ID: {}", analysis_ids[symbol])
+            results[symbol] = self._handle_result(symbol, final_state)
+
+        duration_ms = int((time.perf_counter() - t0) * 1000)
+        succeeded = sum(results.values())
+        round_log.bind(duration_ms=duration_ms, succeeded=succeeded).info(
+            "本轮分析结束: 成功 {}/{}，耗时 {} ms", succeeded, len(symbols), duration_ms
+        )
+        return results
+
+    async def _run_analyses(
+        self, symbols: List[str], verbose: bool, started_at: str
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        通过批量分析工作流并发运行一组交易对，同时运行的工作流不超过 MAX_CONCURRENT_ANALYSES
 
-            # 保存到数据库
-            analysis_result = final_state["analysis_result"]
-            analysis_id = self.repo.save_analysis(symbol, final_state, analysis_result)
-            logger.info(f"分析结果已保存，ID: {analysis_id}")
+        Returns:
+            {交易对: 工作流最终状态}，顺序与 symbols 一致，分析失败的交易对为 None
+        """
+        for symbol in dict.fromkeys(symbols):
+            self.analysis_count += 1
+            logger.debug("[{}] 开始分析 {} (第 {} 次)", started_at, symbol, self.analysis_count)
+
+        # 本轮使用同一个运行 ID，AI分析失败的交易对用该运行 ID 重试一次，复用已采集的数据
+        run_id = uuid.uuid4().hex
+        states = await arun_trading_analysis_batch(
+            symbols, verbose, max_concurrency=MAX_CONCURRENT_ANALYSES, run_id=run_id
+        )
+        retry_symbols = [symbol for symbol, final_state in states.items() if can_resume(final_state)]
+        if retry_symbols:
+            logger.warning("{} AI分析失败，复用已采集的数据重试", ', '.join(retry_symbols))
+            states.update(await arun_trading_analysis_batch(
+                retry_symbols, verbose, max_concurrency=MAX_CONCURRENT_ANALYSES, run_id=run_id
+            ))
+
+        for symbol, final_state in states.items():
+            if final_state is not None and not final_state.get("analysis_result"):
+                logger.warning("{} 分析失败", symbol)
+                states[symbol] = None
+        return states
+
+    def _handle_result(self, symbol: str, final_state: Dict[str, Any]) -> bool:
+        """
+        输出市场数据并在有交易机会时发送告警
 
+        Returns:
+            bool: 是否处理成功
+        """
+        try:
             # 无论有无交易机会，都打印市场数据
             self._log_market_data(symbol, final_state)
 
@@ -60,16 +155,16 @@ class TradingMonitor:
                 # 使用repository的方法提取告警数据
                 alert_data = self.repo.extract_alert_data(final_state)
 
-                # 传递完整的AI分析文本
-                self.alert_manager.send_alert(symbol, alert_data, analysis_result)
-                logger.info(f"✅ 检测到交易机会！已发送告警")
+                # 传递完整的AI分析文本（飞书消息由告警管理器在后台合并发送）
+                self.alert_manager.send_alert(symbol, alert_data, final_state["analysis_result"])
+                logger.info("✅ 检测到交易机会！已加入告警队列")
             else:
-                logger.info(f"⏭️  暂无交易机会")
+                logger.info("⏭️  暂无交易机会")
 
             return True
 
         except Exception as e:
-            logger.error(f"分析 {symbol} 时出错: {e}", exc_info=True)
+            logger.error("处理 {} 分析结果时出错: {}", symbol, e, exc_info=True)
             return False
 
     def _log_market_data(self, symbol: str, final_state: dict):
@@ -80,73 +175,68 @@ class TradingMonitor:
             symbol: 交易对
             final_state: 工作流最终状态
         """
-        logger.info("=" * 70)
-        logger.info(f"【{symbol} 市场数据摘要】")
+        # 整个摘要拼成一条多行日志输出，避免逐行写入与其他线程的日志交错
+        lines = [SEPARATOR, f"【{symbol} 市场数据摘要】"]
 
         # K线数据
-        kline_data = final_state.get('kline_volume', {})
-        if kline_data:
+        if kline_data := final_state.get('kline_volume'):
             current_price = kline_data.get('current_price')
             price_change = kline_data.get('price_change_pct')
             volume_change = kline_data.get('volume_change_pct')
 
             if current_price:
-                logger.info(f"当前价格: ${current_price:,.2f}")
+                lines.append(f"当前价格: ${current_price:,.2f}")
             if price_change is not None:
                 direction = "📈" if price_change > 0 else "📉" if price_change < 0 else "➡️"
-                logger.info(f"24h涨跌: {direction} {price_change:+.2f}%")
+                lines.append(f"24h涨跌: {direction} {price_change:+.2f}%")
             if volume_change is not None:
-                logger.info(f"成交量变化: {volume_change:+.2f}%")
+                lines.append(f"成交量变化: {volume_change:+.2f}%")
 
         # 资金费率
-        funding_data = final_state.get('funding_rate', {})
-        if funding_data:
+        if funding_data := final_state.get('funding_rate'):
             current_rate = funding_data.get('current_rate')
             if current_rate is not None:
                 sentiment = "多头" if current_rate > 0 else "空头" if current_rate < 0 else "中性"
-                logger.info(f"资金费率: {current_rate:.4f}% ({sentiment})")
+                lines.append(f"资金费率: {current_rate:.4f}% ({sentiment})")
 
         # 市场压力
-        liquidation_data = final_state.get('liquidation', {})
-        if liquidation_data:
+        if liquidation_data := final_state.get('liquidation'):
             total_liquidation = liquidation_data.get('total_liquidation_usd')
             if total_liquidation:
-                logger.info(f"市场压力: ${total_liquidation:,.0f}")
+                lines.append(f"市场压力: ${total_liquidation:,.0f}")
 
         # 消息面数据
-        news_data = final_state.get('news_sentiment', {})
-        if news_data:
+        if news_data := final_state.get('news_sentiment'):
             overall_sentiment = news_data.get('overall_sentiment', {})
             if isinstance(overall_sentiment, dict):
                 sentiment = overall_sentiment.get('sentiment')
                 score = overall_sentiment.get('score')
                 if sentiment:
-                    logger.info(f"消息面情绪: {sentiment} (评分: {score:.2f})" if score is not None else f"消息面情绪: {sentiment}")
+                    if score is not None:
+                        lines.append(f"消息面情绪: {sentiment} (评分: {score:.2f})")
+                    else:
+                        lines.append(f"消息面情绪: {sentiment}")
 
             # 如果有具体的新闻标题
-            crypto_news = news_data.get('crypto_news', {})
-            news_list = crypto_news.get('news', [])
-            if news_list and len(news_list) > 0:
-                logger.info(f"相关新闻数: {len(news_list)} 条")
-                logger.info("最新消息:")
+            news_list = (news_data.get('crypto_news') or {}).get('news')
+            if news_list:
+                lines.append(f"相关新闻数: {len(news_list)} 条")
+                lines.append("最新消息:")
                 for i, news in enumerate(news_list[:3], 1):  # 只显示前3条
                     title = news.get('title', '')
                     if title:
-                        logger.info(f"  {i}. {title[:60]}...")
+                        lines.append(f"  {i}. {title[:60]}...")
 
         # 触发的信号
-        triggered_signals = final_state.get('triggered_signals', [])
-        if triggered_signals:
-            logger.info(f"触发信号: {', '.join(triggered_signals)}")
-        else:
-            logger.info("触发信号: 无")
+        triggered_signals = final_state.get('triggered_signals')
+        lines.append(f"触发信号: {', '.join(triggered_signals) if triggered_signals else '无'}")
 
         # 信号摘要
-        signal_summary = final_state.get('signal_summary', '')
-        if signal_summary:
-            logger.info(f"信号摘要: {signal_summary}")
+        if signal_summary := final_state.get('signal_summary'):
+            lines.append(f"信号摘要: {signal_summary}")
 
-        logger.info("=" * 70)
+        lines.append(SEPARATOR)
+        logger.info("\n".join(lines))
 
     def update_signals(self, symbol: str, hours: int = 24) -> int:
         """
@@ -159,19 +249,25 @@ class TradingMonitor:
         Returns:
             int: 更新的信号数量
         """
-        logger.info(f"更新 {symbol} 的信号表现...")
+        logger.info("更新 {} 的信号表现...", symbol)
         try:
             updated_count = self.tracker.update_signal_performance(symbol, hours=hours)
-            logger.info(f"已更新 {symbol} 的信号表现，更新了 {updated_count} 条记录")
+            logger.info("已更新 {} 的信号表现，更新了 {} 条记录", symbol, updated_count)
             return updated_count
         except Exception as e:
-            logger.error(f"更新信号表现失败: {e}", exc_info=True)
+            logger.error("更新信号表现失败: {}", e, exc_info=True)
             return 0
 
     def get_analysis_count(self) -> int:
         """获取分析次数"""
         return self.analysis_count
 
+    def close(self):
+        """关闭事件循环和分析线程池，发送完待发的告警并关闭告警连接"""
+        self._loop.close()
+        self._pool.shutdown(wait=True)
+        self.alert_manager.close()
+
 
 def run_monitor_mode(symbols: List[str], interval: int, verbose: bool = False):
     """
@@ -190,21 +286,17 @@ def run_monitor_mode(symbols: List[str], interval: int, verbose: bool = False):
     # 初始化调度器
     scheduler = TradingScheduler()
 
-    # 显示启动信息
-    logger.info("=" * 70)
-    logger.info("启动监控模式")
-    logger.info(f"监控币种: {', '.join(symbols)}")
-    logger.info(f"监控间隔: {interval} 分钟")
-    logger.info("自动保存: 开启")
-    logger.info("自动更新信号: 每小时一次")
-    logger.info(f"飞书告警: {'开启' if monitor.alert_manager.feishu_enabled else '关闭'}")
-    logger.info("=" * 70)
+    # 显示启动信息（一条记录，配置同时绑定到 extra 便于检索）
+    feishu = '开启' if monitor.alert_manager.feishu_enabled else '关闭'
+    logger.bind(event="monitor_start", symbols=symbols, interval=interval).info(
+        "启动监控模式 | 监控币种: {} | 监控间隔: {} 分钟 | 自动保存: 开启 | 自动更新信号: 每小时一次 | 飞书告警: {}",
+        ', '.join(symbols), interval, feishu
+    )
 
     # 定义分析任务
     def analysis_job():
         """分析任务"""
-        for symbol in symbols:
-            monitor.analyze_symbol(symbol, verbose)
+        monitor.analyze_symbols(symbols, verbose)
 
     # 定义信号更新任务
     def signal_update_job():
@@ -226,12 +318,16 @@ def run_monitor_mode(symbols: List[str], interval: int, verbose: bool = False):
         job_id="signal_update"
     )
 
-    # 立即执行一次分析
-    logger.info("执行首次分析...")
-    analysis_job()
+    # 首次分析也放在 try 中，期间中断时同样会关闭监控器、发送完待发的告警
+    try:
+        # 立即执行一次分析
+        logger.info("执行首次分析...")
+        analysis_job()
 
-    # 启动调度器
-    scheduler.start()
+        # 启动调度器
+        scheduler.start()
+    finally:
+        monitor.close()
 
     # 调度器停止后显示统计
-    logger.info(f"监控已停止，共完成 {monitor.get_analysis_count()} 次分析")
+    logger.info("监控已停止，共完成 {} 次分析", monitor.get_analysis_count())
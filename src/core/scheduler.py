@@ -1,6 +1,8 @@
 """
 调度器模块 - 使用APScheduler实现专业的任务调度
 """
+import signal
+import threading
 from datetime import datetime
 from typing import Callable
 from loguru import logger
@@ -8,24 +10,41 @@ from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
+# 日志分隔线
+SEPARATOR = "=" * 70
+
+# 所有任务的默认设置
+JOB_DEFAULTS = {
+    'coalesce': True,          # 错过的多次执行合并为一次
+    'max_instances': 1,        # 同一任务同一时间只运行一个实例
+    'misfire_grace_time': 30,  # 延迟 30 秒内仍然执行（默认 1 秒，上一轮稍有超时就会被跳过）
+}
+
 
 class TradingScheduler:
     """交易分析调度器"""
 
     def __init__(self):
         """初始化调度器"""
-        self.scheduler = BlockingScheduler()
+        # BlockingScheduler 按下一次任务的触发时间休眠，不做轮询
+        self.scheduler = BlockingScheduler(job_defaults=JOB_DEFAULTS)
         self._setup_event_listeners()
 
+        # BlockingScheduler 在两次任务之间阻塞等待，SIGTERM 按 Ctrl+C 处理，
+        # 让 systemd 等进程管理器停止服务时也能立即唤醒并正常关闭。
+        # 创建调度器时就设置，启动前的首次分析期间收到 SIGTERM 也能正常关闭
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, signal.default_int_handler)
+
     def _setup_event_listeners(self):
         """设置事件监听器"""
         def job_executed_listener(event):
             """任务执行成功监听"""
-            logger.debug(f"任务执行完成: {event.job_id}")
+            logger.debug("任务执行完成: {}", event.job_id)
 
         def job_error_listener(event):
             """任务执行失败监听"""
-            logger.error(f"任务执行失败: {event.job_id}, 异常: {event.exception}")
+            logger.error("任务执行失败: {}, 异常: {}", event.job_id, event.exception)
 
         self.scheduler.add_listener(job_executed_listener, EVENT_JOB_EXECUTED)
         self.scheduler.add_listener(job_error_listener, EVENT_JOB_ERROR)
@@ -54,11 +73,9 @@ class TradingScheduler:
             id=job_id,
             kwargs=kwargs,
             replace_existing=True,
-            max_instances=1,  # 同一时间只运行一个实例
-            coalesce=True,    # 如果错过了执行时间，只执行一次
         )
 
-        logger.info(f"已添加定时任务: {job_id}, 间隔: {minutes} 分钟")
+        logger.info("已添加定时任务: {}, 间隔: {} 分钟", job_id, minutes)
 
     def add_cron_job(
         self,
@@ -86,31 +103,29 @@ class TradingScheduler:
             id=job_id,
             kwargs=kwargs,
             replace_existing=True,
-            max_instances=1,
-            coalesce=True,
         )
 
-        logger.info(f"已添加定时任务: {job_id}, 执行时间: {hour:02d}:{minute:02d}")
+        logger.info("已添加定时任务: {}, 执行时间: {:02d}:{:02d}", job_id, hour, minute)
 
     def start(self):
         """启动调度器"""
-        logger.info("=" * 70)
+        logger.info(SEPARATOR)
         logger.info("调度器启动")
-        logger.info(f"当前时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("当前时间: {}", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
         # 显示所有任务
         jobs = self.scheduler.get_jobs()
         if jobs:
-            logger.info(f"已注册任务数: {len(jobs)}")
+            logger.info("已注册任务数: {}", len(jobs))
             for job in jobs:
                 next_run = getattr(job, 'next_run_time', None)
                 if next_run:
-                    logger.info(f"  - {job.id}: 下次执行时间 {next_run}")
+                    logger.info("  - {}: 下次执行时间 {}", job.id, next_run)
                 else:
-                    logger.info(f"  - {job.id}")
+                    logger.info("  - {}", job.id)
 
         logger.info("按 Ctrl+C 停止调度器")
-        logger.info("=" * 70)
+        logger.info(SEPARATOR)
 
         try:
             self.scheduler.start()
@@ -133,4 +148,4 @@ class TradingScheduler:
     def remove_job(self, job_id: str):
         """移除任务"""
         self.scheduler.remove_job(job_id)
-        logger.info(f"已移除任务: {job_id}")
+        logger.info("已移除任务: {}", job_id)
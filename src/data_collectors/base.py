@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+import asyncio
 import time
 from typing import Any, Dict
+import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 from config.settings import settings
 
@@ -11,6 +14,19 @@ class BaseCollector(ABC):
     def __init__(self):
         self.max_retries = settings.MAX_RETRIES
         self.retry_delay = settings.RETRY_DELAY
+        # 采集器实例在多次分析间共享，复用同一个会话可保持 keep-alive 连接，省去重复的 TCP/TLS 握手
+        self.session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """创建带连接池的 HTTP 会话（失败重试由 _retry_on_error 负责）"""
+        session = requests.Session()
+        # 监控模式下采集请求在 TradingMonitor 的线程池（MAX_WORKERS=8）中执行，
+        # 连接池不小于线程数，并发请求时连接不会因池满被丢弃
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _retry_on_error(self, func, *args, **kwargs) -> Any:
         """带重试机制的函数调用"""
@@ -31,3 +47,7 @@ class BaseCollector(ABC):
     def collect(self, symbol: str) -> Dict[str, Any]:
         """采集数据，子类必须实现"""
         pass
+
+    async def acollect(self, symbol: str) -> Dict[str, Any]:
+        """异步采集数据：同步的 collect 放到线程中执行，不阻塞事件循环"""
+        return await asyncio.to_thread(self.collect, symbol)
@@ -16,16 +16,13 @@ class FundingRateCollector(BaseCollector):
         logger.info(f"采集资金费率数据: {symbol}")
 
         def _fetch():
-            # 获取当前资金费率
-            current_rate = self.client.futures_funding_rate(symbol=symbol, limit=1)
-            if not current_rate:
+            # 获取历史资金费率（近24条，按时间升序），最后一条即当前资金费率，一次请求取全
+            history_rates = self.client.futures_funding_rate(symbol=symbol, limit=24)
+            if not history_rates:
                 raise ValueError("无法获取当前资金费率")
 
-            current_rate_value = float(current_rate[0]["fundingRate"])
-
-            # 获取历史资金费率（近24小时）
-            history_rates = self.client.futures_funding_rate(symbol=symbol, limit=24)
             history_values = [float(r["fundingRate"]) for r in history_rates]
+            current_rate_value = history_values[-1]
 
             # 计算统计信息
             max_rate = max(history_values)
@@ -24,21 +24,9 @@ class KlineVolumeCollector(BaseCollector):
             if not klines:
                 raise ValueError("无法获取K线数据")
 
-            # 解析K线数据
-            prices = []
-            volumes = []
-            times = []
-
-            for kline in klines:
-                open_price = float(kline[1])
-                high_price = float(kline[2])
-                low_price = float(kline[3])
-                close_price = float(kline[4])
-                volume = float(kline[7])  # 成交额
-
-                prices.append(close_price)
-                volumes.append(volume)
-                times.append(kline[0])
+            # 解析K线数据（只转换用到的收盘价和成交额两列）
+            prices = [float(kline[4]) for kline in klines]
+            volumes = [float(kline[7]) for kline in klines]  # 成交额
 
             # 计算价格统计
             current_price = prices[-1]
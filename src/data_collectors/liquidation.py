@@ -1,6 +1,7 @@
 from typing import Dict, Any
-import requests
+import asyncio
 from loguru import logger
+from src.utils import json_utils
 from .base import BaseCollector
 
 
@@ -33,47 +34,76 @@ class LiquidationCollector(BaseCollector):
                 # 3. 获取主动买卖量
                 taker_volume = self._get_taker_volume(symbol)
 
-                # 分析市场压力
-                signal, risk_level = self._analyze_market_pressure(
-                    long_short_ratio, taker_volume
-                )
-
-                return {
-                    "open_interest": oi_data.get("openInterest", "0"),
-                    "long_short_ratio": long_short_ratio.get("longShortRatio", "0"),
-                    "long_account_pct": float(long_short_ratio.get("longAccount", "0")) * 100,
-                    "short_account_pct": float(long_short_ratio.get("shortAccount", "0")) * 100,
-                    "buy_sell_ratio": taker_volume.get("buySellRatio", "0"),
-                    "buy_volume": taker_volume.get("buyVol", "0"),
-                    "sell_volume": taker_volume.get("sellVol", "0"),
-                    "risk_level": risk_level,
-                    "signal": signal,
-                    "data_available": True,
-                }
+                return self._build_result(oi_data, long_short_ratio, taker_volume)
 
             except Exception as e:
                 logger.error(f"获取市场压力数据失败: {str(e)}")
-                return {
-                    "open_interest": "0",
-                    "long_short_ratio": "0",
-                    "long_account_pct": 0.0,
-                    "short_account_pct": 0.0,
-                    "buy_sell_ratio": "0",
-                    "buy_volume": "0",
-                    "sell_volume": "0",
-                    "risk_level": "未知",
-                    "signal": "无法获取数据",
-                    "data_available": False,
-                }
+                return self._unavailable_result()
 
         return self._retry_on_error(_fetch)
 
+    async def acollect(self, symbol: str) -> Dict[str, Any]:
+        """异步采集市场压力数据：三个接口互不依赖，同时请求"""
+        logger.info(f"采集市场压力数据: {symbol}")
+
+        try:
+            oi_data, long_short_ratio, taker_volume = await asyncio.gather(
+                asyncio.to_thread(self._get_open_interest, symbol),
+                asyncio.to_thread(self._get_long_short_ratio, symbol),
+                asyncio.to_thread(self._get_taker_volume, symbol),
+            )
+            return self._build_result(oi_data, long_short_ratio, taker_volume)
+        except Exception as e:
+            logger.error(f"获取市场压力数据失败: {str(e)}")
+            return self._unavailable_result()
+
+    def _build_result(
+        self,
+        oi_data: Dict[str, Any],
+        long_short_ratio: Dict[str, Any],
+        taker_volume: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """根据三个接口的返回数据生成采集结果"""
+        # 分析市场压力
+        signal, risk_level = self._analyze_market_pressure(
+            long_short_ratio, taker_volume
+        )
+
+        return {
+            "open_interest": oi_data.get("openInterest", "0"),
+            "long_short_ratio": long_short_ratio.get("longShortRatio", "0"),
+            "long_account_pct": float(long_short_ratio.get("longAccount", "0")) * 100,
+            "short_account_pct": float(long_short_ratio.get("shortAccount", "0")) * 100,
+            "buy_sell_ratio": taker_volume.get("buySellRatio", "0"),
+            "buy_volume": taker_volume.get("buyVol", "0"),
+            "sell_volume": taker_volume.get("sellVol", "0"),
+            "risk_level": risk_level,
+            "signal": signal,
+            "data_available": True,
+        }
+
+    @staticmethod
+    def _unavailable_result() -> Dict[str, Any]:
+        """获取数据失败时返回的默认结果"""
+        return {
+            "open_interest": "0",
+            "long_short_ratio": "0",
+            "long_account_pct": 0.0,
+            "short_account_pct": 0.0,
+            "buy_sell_ratio": "0",
+            "buy_volume": "0",
+            "sell_volume": "0",
+            "risk_level": "未知",
+            "signal": "无法获取数据",
+            "data_available": False,
+        }
+
     def _get_open_interest(self, symbol: str) -> Dict[str, Any]:
         """获取持仓量"""
         url = f"{self.base_url}/fapi/v1/openInterest"
-        response = requests.get(url, params={"symbol": symbol}, timeout=10)
+        response = self.session.get(url, params={"symbol": symbol}, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return json_utils.loads(response.content)
 
     def _get_long_short_ratio(self, symbol: str) -> Dict[str, Any]:
         """获取多空比（最新数据）"""
@@ -83,9 +113,9 @@ class LiquidationCollector(BaseCollector):
             "period": "5m",
             "limit": 1
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = self.session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = json_utils.loads(response.content)
         return data[0] if data else {}
 
     def _get_taker_volume(self, symbol: str) -> Dict[str, Any]:
@@ -96,9 +126,9 @@ class LiquidationCollector(BaseCollector):
             "period": "5m",
             "limit": 1
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = self.session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = json_utils.loads(response.content)
         return data[0] if data else {}
 
     def _analyze_market_pressure(
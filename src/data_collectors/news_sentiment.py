@@ -1,6 +1,7 @@
 from typing import Dict, Any, List
-import requests
+import asyncio
 from loguru import logger
+from src.utils import json_utils
 from .base import BaseCollector
 from config.settings import settings
 from datetime import datetime
@@ -14,14 +15,6 @@ class NewsSentimentCollector(BaseCollector):
         super().__init__()
         self.cryptocompare_api_key = settings.CRYPTOCOMPARE_API_KEY
         self.newsapi_key = settings.NEWSAPI_KEY
-        self.db = None  # 延迟初始化
-
-    def _get_db(self):
-        """延迟初始化数据库连接"""
-        if self.db is None:
-            from src.database.models import Database
-            self.db = Database()
-        return self.db
 
     def collect(self, symbol: str) -> Dict[str, Any]:
         """采集消息面数据"""
@@ -36,28 +29,52 @@ class NewsSentimentCollector(BaseCollector):
             social_sentiment = self._get_social_sentiment(coin)
             macro_news = self._get_macro_news()
 
-            # 综合分析
-            overall_sentiment = self._calculate_overall_sentiment(
-                crypto_news, social_sentiment, macro_news
-            )
+            return self._build_result(crypto_news, social_sentiment, macro_news)
 
-            # 检查是否有任何可用数据
-            data_available = (
-                crypto_news.get("data_available", False) or
-                social_sentiment.get("data_available", False) or
-                macro_news.get("data_available", False)
-            )
+        return self._retry_on_error(_fetch)
 
-            return {
-                "crypto_news": crypto_news,
-                "social_sentiment": social_sentiment,
-                "macro_news": macro_news,
-                "overall_sentiment": overall_sentiment,
-                "timestamp": datetime.now().isoformat(),
-                "data_available": data_available,
-            }
+    async def acollect(self, symbol: str) -> Dict[str, Any]:
+        """异步采集消息面数据：三个数据源互不依赖，同时请求"""
+        logger.info(f"采集消息面数据: {symbol}")
 
-        return self._retry_on_error(_fetch)
+        # 提取币种名称（去掉USDT后缀）
+        coin = symbol.replace("USDT", "").replace("BUSD", "")
+
+        # 各数据源内部已处理异常并返回 data_available=False 的结果
+        crypto_news, social_sentiment, macro_news = await asyncio.gather(
+            asyncio.to_thread(self._get_crypto_news, coin),
+            asyncio.to_thread(self._get_social_sentiment, coin),
+            asyncio.to_thread(self._get_macro_news),
+        )
+        return self._build_result(crypto_news, social_sentiment, macro_news)
+
+    def _build_result(
+        self,
+        crypto_news: Dict[str, Any],
+        social_sentiment: Dict[str, Any],
+        macro_news: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """汇总各数据源的结果"""
+        # 综合分析
+        overall_sentiment = self._calculate_overall_sentiment(
+            crypto_news, social_sentiment, macro_news
+        )
+
+        # 检查是否有任何可用数据
+        data_available = (
+            crypto_news.get("data_available", False) or
+            social_sentiment.get("data_available", False) or
+            macro_news.get("data_available", False)
+        )
+
+        return {
+            "crypto_news": crypto_news,
+            "social_sentiment": social_sentiment,
+            "macro_news": macro_news,
+            "overall_sentiment": overall_sentiment,
+            "timestamp": datetime.now().isoformat(),
+            "data_available": data_available,
+        }
 
     def _get_crypto_news(self, coin: str) -> Dict[str, Any]:
         """获取加密货币新闻（CryptoCompare API）- 带去重机制"""
@@ -82,14 +99,16 @@ class NewsSentimentCollector(BaseCollector):
             }
             headers = {"authorization": f"Apikey {self.cryptocompare_api_key}"}
 
-            response = requests.get(url, params=params, headers=headers, timeout=20)
+            response = self.session.get(url, params=params, headers=headers, timeout=20)
             response.raise_for_status()
-            data = response.json()
+            data = json_utils.loads(response.content)
 
             # 检查是否有数据返回（CryptoCompare API v2格式）
             if "Data" in data and data.get("Data"):
-                from src.database.models import ProcessedNews
-                db = self._get_db()
+                from src.database.models import ProcessedNews, get_read_db, get_write_db
+                # 查重走当前线程的只读连接（不抢占写锁），只有新新闻才经共享写连接写入
+                read_db = get_read_db()
+                write_db = get_write_db()
 
                 news_items = data.get("Data", [])[:10]  # 取最新10条
 
@@ -109,11 +128,11 @@ class NewsSentimentCollector(BaseCollector):
                     news_id = hashlib.md5(f"{title}_{published_time}".encode()).hexdigest()
 
                     # 检查是否已处理（但不跳过，仍然采集）
-                    is_new = not ProcessedNews.is_processed(db, coin, news_id)
+                    is_new = not ProcessedNews.is_processed(read_db, coin, news_id)
                     if is_new:
                         new_news_count += 1
                         # 记录已处理的新闻
-                        ProcessedNews.create(db, coin, news_id, title, source, published_time, "")
+                        ProcessedNews.create(write_db, coin, news_id, title, source, published_time, "")
 
                     sentiment = self._analyze_news_sentiment(title)
 
@@ -191,9 +210,9 @@ class NewsSentimentCollector(BaseCollector):
             params = {"coinId": self._get_coin_id(coin)}
             headers = {"authorization": f"Apikey {self.cryptocompare_api_key}"}
 
-            response = requests.get(url, params=params, headers=headers, timeout=20)
+            response = self.session.get(url, params=params, headers=headers, timeout=20)
             response.raise_for_status()
-            data = response.json()
+            data = json_utils.loads(response.content)
 
             # 检查是否有数据返回
             if "Data" in data and data.get("Data"):
@@ -254,9 +273,9 @@ class NewsSentimentCollector(BaseCollector):
                 "apiKey": self.newsapi_key,
             }
 
-            response = requests.get(url, params=params, timeout=20)
+            response = self.session.get(url, params=params, timeout=20)
             response.raise_for_status()
-            data = response.json()
+            data = json_utils.loads(response.content)
 
             if data.get("status") == "ok":
                 articles = data.get("articles", [])[:5]
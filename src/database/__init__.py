@@ -1,9 +1,11 @@
 ﻿"""数据库模块"""
-from .models import init_database, Database, AnalysisRecord, SignalRecord, PriceRecord, SignalPerformance
+from .models import init_database, get_write_db, get_read_db, Database, AnalysisRecord, SignalRecord, PriceRecord, SignalPerformance
 from .repository import AnalysisRepository
 
 __all__ = [
     'init_database',
+    'get_write_db',
+    'get_read_db',
     'Database',
     'AnalysisRecord',
     'SignalRecord',
@@ -2,6 +2,7 @@
 数据库模型定义
 """
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -9,15 +10,40 @@ from loguru import logger
 
 
 class Database:
-    def __init__(self, db_path: str = "data/trading_agent.db"):
+    def __init__(self, db_path: str = "data/trading_agent.db", persistent: bool = False,
+                 read_only: bool = False):
+        """
+        Args:
+            db_path: 数据库文件路径
+            persistent: 是否保持长连接（退出 with 块时不关闭连接，可跨线程复用）
+            read_only: 是否为只读连接（禁止写入，事务不抢占写锁）
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.persistent = persistent
+        self.read_only = read_only
         self.conn = None
+        # 长连接会被多个线程共享，同一时间只允许一个事务使用
+        self._lock = threading.RLock()
+        # with 块嵌套深度，外层开启事务，内层使用保存点
+        self._depth = 0
         
     def connect(self):
         if self.conn is None:
-            self.conn = sqlite3.connect(str(self.db_path))
+            # 关闭驱动的隐式事务，事务边界完全由 __enter__/__exit__ 控制
+            self.conn = sqlite3.connect(
+                str(self.db_path),
+                isolation_level=None,
+                check_same_thread=not self.persistent,
+            )
             self.conn.row_factory = sqlite3.Row
+            # 以下设置只对当前连接生效，每个连接都要设置
+            # WAL 模式下 NORMAL 只在检查点时 fsync，提交不再每次落盘
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA mmap_size=268435456")
+            if self.read_only:
+                self.conn.execute("PRAGMA query_only=1")
         return self.conn
     
     def close(self):
@@ -26,20 +52,108 @@ class Database:
             self.conn = None
     
     def __enter__(self):
-        return self.connect()
+        # 只读连接使用 DEFERRED 事务，在 WAL 模式下读取快照，不与写入者争锁
+        return self._begin("BEGIN" if self.read_only else "BEGIN IMMEDIATE")
+
+    def _begin(self, begin_sql: str):
+        self._lock.acquire()
+        try:
+            conn = self.connect()
+            if self._depth == 0:
+                conn.execute(begin_sql)
+            else:
+                # 已处于批量事务中，内层只建保存点，不单独提交
+                conn.execute(f"SAVEPOINT sp_{self._depth}")
+        except Exception:
+            self._lock.release()
+            raise
+        self._depth += 1
+        return conn
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.conn:
-            if exc_type is None:
-                self.conn.commit()
-            else:
-                self.conn.rollback()
-            self.close()
+        try:
+            self._depth -= 1
+            if self.conn:
+                if self._depth > 0:
+                    savepoint = f"sp_{self._depth}"
+                    if exc_type is not None:
+                        self.conn.execute(f"ROLLBACK TO {savepoint}")
+                    self.conn.execute(f"RELEASE {savepoint}")
+                    return
+                if exc_type is None:
+                    self.conn.commit()
+                else:
+                    self.conn.rollback()
+                if not self.persistent:
+                    self.close()
+        finally:
+            self._lock.release()
+
+    def transaction(self):
+        """
+        批量写入事务
+
+        在 with 块内的多次写入只提交一次，内层写入失败时仅回滚到其保存点。
+        """
+        return self
+
+    def read(self):
+        """
+        只读查询
+
+        以 DEFERRED 事务开始，可写连接上的查询也不会抢占数据库写锁。
+        """
+        return _ReadTransaction(self)
+
+
+class _ReadTransaction:
+    """Database.read() 返回的上下文，退出逻辑与 Database 相同"""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def __enter__(self):
+        return self.db._begin("BEGIN")
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self.db.__exit__(exc_type, exc_val, exc_tb)
+
+
+# 写连接：每个数据库文件一个进程内共享的长连接，写入经 Database 内部锁串行化
+_write_dbs: Dict[str, Database] = {}
+_write_dbs_lock = threading.Lock()
+# 读连接：每个线程每个数据库文件一个只读长连接，查询之间互不等待
+_read_dbs = threading.local()
+
+
+def get_write_db(db_path: str = "data/trading_agent.db") -> Database:
+    """获取数据库文件的共享写连接"""
+    key = str(Path(db_path).resolve())
+    with _write_dbs_lock:
+        db = _write_dbs.get(key)
+        if db is None:
+            db = _write_dbs[key] = Database(db_path, persistent=True)
+        return db
+
+
+def get_read_db(db_path: str = "data/trading_agent.db") -> Database:
+    """获取当前线程的只读连接（PRAGMA query_only=1）"""
+    dbs = getattr(_read_dbs, "dbs", None)
+    if dbs is None:
+        dbs = _read_dbs.dbs = {}
+    key = str(Path(db_path).resolve())
+    db = dbs.get(key)
+    if db is None:
+        db = dbs[key] = Database(db_path, persistent=True, read_only=True)
+    return db
 
 
 def init_database(db_path: str = "data/trading_agent.db"):
     logger.info(f"初始化数据库: {db_path}")
     db = Database(db_path)
+    # WAL 模式写入数据库文件，之后所有连接都生效；读写互不阻塞。
+    # journal_mode 不能在事务中修改，需在 BEGIN 之前执行
+    db.connect().execute("PRAGMA journal_mode=WAL")
     with db as conn:
         cursor = conn.cursor()
         
@@ -96,9 +210,20 @@ def init_database(db_path: str = "data/trading_agent.db"):
             return_24h REAL,
             hit_target BOOLEAN,
             hit_stop_loss BOOLEAN,
+            exit_price REAL,
+            exit_time DATETIME,
+            price_change_pct REAL,
+            is_profitable BOOLEAN,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             updated_at DATETIME DEFAULT CURRENT_TIMESTAMP)""")
 
+        # 旧数据库的 signal_performance 缺少准确率追踪使用的平仓字段，补充缺失的列
+        columns = {row['name'] for row in cursor.execute("PRAGMA table_info(signal_performance)")}
+        for column, column_type in (('exit_price', 'REAL'), ('exit_time', 'DATETIME'),
+                                    ('price_change_pct', 'REAL'), ('is_profitable', 'BOOLEAN')):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE signal_performance ADD COLUMN {column} {column_type}")
+
         cursor.execute("""CREATE TABLE IF NOT EXISTS processed_news (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
@@ -115,8 +240,7 @@ def init_database(db_path: str = "data/trading_agent.db"):
 
         cursor.execute("""CREATE INDEX IF NOT EXISTS idx_processed_news_symbol_time
             ON processed_news(symbol, published_time DESC)""")
-            
-        conn.commit()
+
         logger.info("数据库初始化完成")
 
 
@@ -143,7 +267,7 @@ class AnalysisRecord:
     
     @staticmethod
     def get_recent(db: Database, symbol: str, limit: int = 10):
-        with db as conn:
+        with db.read() as conn:
             cursor = conn.cursor()
             cursor.execute("""SELECT * FROM analysis_records 
                 WHERE symbol = ? ORDER BY timestamp DESC LIMIT ?""", (symbol, limit))
@@ -153,15 +277,18 @@ class AnalysisRecord:
 class SignalRecord:
     @staticmethod
     def create(db: Database, analysis_id: int, signals: list):
+        if not signals:
+            return
+        now = datetime.now()
+        rows = [(
+            analysis_id, signal.get('symbol'), signal.get('timestamp', now),
+            signal.get('type'), signal.get('strength'),
+            signal.get('value'), signal.get('description')) for signal in signals]
         with db as conn:
-            cursor = conn.cursor()
-            for signal in signals:
-                cursor.execute("""INSERT INTO signal_records (
-                    analysis_id, symbol, timestamp, signal_type, signal_strength, 
-                    signal_value, signal_description) VALUES (?, ?, ?, ?, ?, ?, ?)""", (
-                    analysis_id, signal.get('symbol'), signal.get('timestamp', datetime.now()),
-                    signal.get('type'), signal.get('strength'),
-                    signal.get('value'), signal.get('description')))
+            # 所有信号一次批量插入
+            conn.executemany("""INSERT INTO signal_records (
+                analysis_id, symbol, timestamp, signal_type, signal_strength, 
+                signal_value, signal_description) VALUES (?, ?, ?, ?, ?, ?, ?)""", rows)
 
 
 class PriceRecord:
@@ -230,8 +357,8 @@ class ProcessedNews:
 
     @staticmethod
     def is_processed(db: Database, symbol: str, news_id: str) -> bool:
-        """检查新闻是否已处理"""
-        with db as conn:
+        """检查新闻是否已处理（只读查询，传入 get_read_db() 的连接可避免占用写锁）"""
+        with db.read() as conn:
             cursor = conn.cursor()
             cursor.execute("""SELECT COUNT(*) as count FROM processed_news
                 WHERE symbol = ? AND news_id = ?""", (symbol, news_id))
@@ -239,8 +366,8 @@ class ProcessedNews:
 
     @staticmethod
     def get_latest_timestamp(db: Database, symbol: str) -> int:
-        """获取最新处理的新闻时间戳"""
-        with db as conn:
+        """获取最新处理的新闻时间戳（只读查询，传入 get_read_db() 的连接可避免占用写锁）"""
+        with db.read() as conn:
             cursor = conn.cursor()
             cursor.execute("""SELECT MAX(published_time) as latest FROM processed_news
                 WHERE symbol = ?""", (symbol,))
@@ -1,18 +1,47 @@
 ﻿"""
 数据仓库 - 提供高级数据查询和统计功能
 """
+import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from loguru import logger
-from .models import Database, AnalysisRecord, SignalRecord, PriceRecord, SignalPerformance
+from .models import get_write_db, get_read_db, AnalysisRecord, SignalRecord, PriceRecord, SignalPerformance
+
+# 分析文本中的字段标签
+_LABEL_RE = re.compile(r'市场趋势判断|支撑位|阻力位|止损位|目标位|建议仓位|信心度')
+_PRICE_FIELDS = {
+    '支撑位': 'support_level',
+    '阻力位': 'resistance_level',
+    '止损位': 'stop_loss',
+    '目标位': 'target_price',
+}
+
+# 趋势方向 / 建议仓位关键词，一次扫描取行内最先出现的关键词
+_TREND_RE = re.compile(r'(看多|看空|震荡)')
+_POS_RE = re.compile(r'(轻仓|中仓|重仓)')
+
+# 信心度，如 80%
+_CONFIDENCE_RE = re.compile(r'(\d+)%')
+# 价格，如 $1234.56 或 $1,234.56
+_PRICE_RE = re.compile(r'\$\s*(\d+(?:,\d{3})*(?:\.\d+)?)')
 
 
 class AnalysisRepository:
     """分析数据仓库"""
     
     def __init__(self, db_path: str = "data/trading_agent.db"):
-        """初始化仓库"""
-        self.db = Database(db_path)
+        """初始化仓库（写入使用共享写连接，查询使用各线程的只读连接）"""
+        self.db_path = db_path
+        self.db = get_write_db(db_path)
+
+    @property
+    def read_db(self):
+        """当前线程的只读连接，查询不占用写连接"""
+        return get_read_db(self.db_path)
+
+    def transaction(self):
+        """批量保存事务，with 块内的多次 save_analysis 只提交一次"""
+        return self.db.transaction()
     
     def save_analysis(self, symbol: str, state: Dict[str, Any], analysis_result: str) -> int:
         """
@@ -27,11 +56,16 @@ class AnalysisRepository:
             分析记录ID
         """
         logger.info(f"保存分析结果: {symbol}")
-        
+
+        # 同一轮分析的所有记录共用一个时间戳
+        now = datetime.now()
+
         # 提取关键信息
-        kline_data = state.get('kline_volume', {})
+        kline_data = state.get('kline_volume') or {}
         current_price = kline_data.get('current_price')
         price_change_24h = kline_data.get('price_change_pct')
+        has_opportunity = state.get('has_trading_opportunity')
+        triggered_signals = state.get('triggered_signals') or []
         
         # 解析AI分析结果中的关键信息
         parsed_data = self._parse_analysis_result(analysis_result)
@@ -39,12 +73,12 @@ class AnalysisRepository:
         # 构建数据
         data = {
             'symbol': symbol,
-            'timestamp': datetime.now(),
+            'timestamp': now,
             'current_price': current_price,
             'price_change_24h': price_change_24h,
-            'has_trading_opportunity': state.get('has_trading_opportunity'),
-            'signal_count': len(state.get('triggered_signals', [])) if state.get('has_trading_opportunity') else 0,
-            'triggered_signals': ','.join(state.get('triggered_signals', [])) if state.get('has_trading_opportunity') else '',
+            'has_trading_opportunity': has_opportunity,
+            'signal_count': len(triggered_signals) if has_opportunity else 0,
+            'triggered_signals': ','.join(triggered_signals) if has_opportunity else '',
             'trend_direction': parsed_data.get('trend_direction'),
             'confidence': parsed_data.get('confidence'),
             'support_level': parsed_data.get('support_level'),
@@ -55,28 +89,30 @@ class AnalysisRepository:
             'full_analysis': analysis_result,
         }
         
-        # 保存分析记录
-        analysis_id = AnalysisRecord.create(self.db, data)
+        # 同一条分析的多条记录在一个事务（或批量事务的保存点）中写入
+        with self.db:
+            # 保存分析记录
+            analysis_id = AnalysisRecord.create(self.db, data)
         
-        # 保存价格记录
-        if current_price:
-            PriceRecord.create(self.db, {
-                'symbol': symbol,
-                'timestamp': datetime.now(),
-                'price': current_price,
-                'volume_24h': kline_data.get('volume_24h'),
-                'funding_rate': state.get('funding_rate', {}).get('current_rate'),
-            })
+            # 保存价格记录
+            if current_price:
+                PriceRecord.create(self.db, {
+                    'symbol': symbol,
+                    'timestamp': now,
+                    'price': current_price,
+                    'volume_24h': kline_data.get('volume_24h'),
+                    'funding_rate': (state.get('funding_rate') or {}).get('current_rate'),
+                })
         
-        # 创建信号表现追踪
-        if current_price and state.get('has_trading_opportunity'):
-            SignalPerformance.create(
-                self.db, 
-                analysis_id, 
-                symbol, 
-                current_price, 
-                datetime.now()
-            )
+            # 创建信号表现追踪
+            if current_price and has_opportunity:
+                SignalPerformance.create(
+                    self.db, 
+                    analysis_id, 
+                    symbol, 
+                    current_price, 
+                    now
+                )
         
         logger.info(f"分析结果已保存，ID: {analysis_id}")
         return analysis_id
@@ -91,8 +127,8 @@ class AnalysisRepository:
         Returns:
             结构化的告警数据
         """
-        kline_data = final_state.get('kline_volume', {})
-        analysis_result = final_state.get('analysis_result', '')
+        kline_data = final_state.get('kline_volume') or {}
+        analysis_result = final_state.get('analysis_result') or ''
 
         # 复用现有的解析逻辑
         parsed = self._parse_analysis_result(analysis_result)
@@ -102,7 +138,7 @@ class AnalysisRepository:
             'price_change_24h': kline_data.get('price_change_pct'),
             'trend_direction': parsed.get('trend_direction', '未知'),
             'confidence': parsed.get('confidence', 0),
-            'triggered_signals': final_state.get('triggered_signals', []),
+            'triggered_signals': final_state.get('triggered_signals') or [],
             'suggested_position': parsed.get('suggested_position'),
             'stop_loss': parsed.get('stop_loss'),
             'target_price': parsed.get('target_price'),
@@ -124,72 +160,36 @@ class AnalysisRepository:
             lines = analysis_text.split('\n')
             
             for i, line in enumerate(lines):
+                # 一次扫描找出行内出现的全部字段标签，没有标签的行直接跳过
+                labels = set(_LABEL_RE.findall(line))
+                if not labels:
+                    continue
                 line = line.strip()
                 
-                # 提取趋势方向
-                if '【市场趋势判断】' in line or '市场趋势判断' in line:
-                    if i + 1 < len(lines):
-                        trend_line = lines[i + 1].strip()
-                        if '看多' in trend_line:
-                            result['trend_direction'] = '看多'
-                        elif '看空' in trend_line:
-                            result['trend_direction'] = '看空'
-                        elif '震荡' in trend_line:
-                            result['trend_direction'] = '震荡'
-                
-                # 提取支撑位和阻力位
-                if '支撑位' in line:
-                    try:
-                        price = self._extract_price(line)
-                        if price:
-                            result['support_level'] = price
-                    except:
-                        pass
-                
-                if '阻力位' in line:
-                    try:
-                        price = self._extract_price(line)
-                        if price:
-                            result['resistance_level'] = price
-                    except:
-                        pass
-                
-                # 提取止损位
-                if '止损位' in line:
-                    try:
-                        price = self._extract_price(line)
-                        if price:
-                            result['stop_loss'] = price
-                    except:
-                        pass
+                # 提取趋势方向（位于标题的下一行）
+                if '市场趋势判断' in labels and i + 1 < len(lines):
+                    match = _TREND_RE.search(lines[i + 1])
+                    if match:
+                        result['trend_direction'] = match.group(1)
                 
-                # 提取目标位
-                if '目标位' in line:
-                    try:
+                # 提取支撑位、阻力位、止损位、目标位
+                for label, field in _PRICE_FIELDS.items():
+                    if label in labels:
                         price = self._extract_price(line)
                         if price:
-                            result['target_price'] = price
-                    except:
-                        pass
+                            result[field] = price
                 
                 # 提取建议仓位
-                if '建议仓位' in line:
-                    if '轻仓' in line:
-                        result['suggested_position'] = '轻仓'
-                    elif '中仓' in line:
-                        result['suggested_position'] = '中仓'
-                    elif '重仓' in line:
-                        result['suggested_position'] = '重仓'
+                if '建议仓位' in labels:
+                    match = _POS_RE.search(line)
+                    if match:
+                        result['suggested_position'] = match.group(1)
                 
                 # 提取信心度
-                if '信心度' in line:
-                    try:
-                        import re
-                        match = re.search(r'(\d+)%', line)
-                        if match:
-                            result['confidence'] = float(match.group(1)) / 100
-                    except:
-                        pass
+                if '信心度' in labels:
+                    match = _CONFIDENCE_RE.search(line)
+                    if match:
+                        result['confidence'] = float(match.group(1)) / 100
         
         except Exception as e:
             logger.warning(f"解析分析结果失败: {e}")
@@ -198,9 +198,7 @@ class AnalysisRepository:
     
     def _extract_price(self, text: str) -> Optional[float]:
         """从文本中提取价格"""
-        import re
-        # 匹配 .56 或 1234.56 格式
-        match = re.search(r'\True\s*(\d+(?:,\d{3})*(?:\.\d+)?)', text)
+        match = _PRICE_RE.search(text)
         if match:
             price_str = match.group(1).replace(',', '')
             return float(price_str)
@@ -208,7 +206,7 @@ class AnalysisRepository:
     
     def get_recent_analyses(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
         """获取最近的分析记录"""
-        records = AnalysisRecord.get_recent(self.db, symbol, limit)
+        records = AnalysisRecord.get_recent(self.read_db, symbol, limit)
         return [dict(record) for record in records]
     
     def get_signal_statistics(self, symbol: str, days: int = 7) -> Dict[str, Any]:
@@ -224,7 +222,7 @@ class AnalysisRepository:
         """
         start_date = datetime.now() - timedelta(days=days)
         
-        with self.db as conn:
+        with self.read_db as conn:
             cursor = conn.cursor()
             
             # 总分析次数
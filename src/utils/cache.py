@@ -0,0 +1,95 @@
+"""
+缓存工具模块
+提供线程安全的带过期时间的 LRU 缓存
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    带过期时间的 LRU 缓存（线程安全）
+
+    条目写入 ttl 秒后过期；条目数超过 maxsize 时淘汰最久未使用的条目。
+    过期时间使用单调时钟计算，不受系统时间调整影响。
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 900):
+        """
+        Args:
+            maxsize: 最多缓存的条目数
+            ttl: 条目有效期（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """获取未过期的缓存值，不存在或已过期时返回 default"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """写入缓存值，ttl 为空时使用默认有效期"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def add(self, key: Hashable, value: Any = True) -> bool:
+        """
+        仅当 key 不存在（或已过期）时写入
+
+        Returns:
+            bool: True 表示已写入，False 表示 key 仍在有效期内
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] > now:
+                return False
+            self._data[key] = (now + self.ttl, value)
+            self._data.move_to_end(key)
+            self._evict()
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """删除并返回缓存值"""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[1]
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _evict(self):
+        """超出容量时先清理过期条目，仍超出则淘汰最久未使用的条目（调用方需持有锁）"""
+        if len(self._data) <= self.maxsize:
+            return
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
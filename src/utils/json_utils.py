@@ -0,0 +1,25 @@
+"""
+JSON 工具模块
+安装了 orjson 时使用 orjson 编解码，否则回退到标准库 json
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """序列化为 UTF-8 编码的 JSON 字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """反序列化 JSON（支持 str / bytes）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
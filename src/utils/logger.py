@@ -8,20 +8,28 @@ def setup_logger():
     # 移除默认处理器
     logger.remove()
 
+    # 日志记录交给后台线程写出（enqueue），多线程并发记录日志时调用方不会阻塞在 I/O 上
     # 添加控制台处理器
     logger.add(
         sys.stdout,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=settings.LOG_LEVEL,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
-    # 添加文件处理器
+    # 添加文件处理器（轮转后的旧日志压缩保存）
     logger.add(
         f"{settings.LOG_DIR}/trade_agent.log",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level=settings.LOG_LEVEL,
         rotation="500 MB",
         retention="7 days",
+        compression="gz",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
     return logger
@@ -2,6 +2,26 @@
 工作流模块
 使用 LangGraph 实现状态管理和并行执行
 """
-from .trading_graph import create_trading_graph, run_trading_analysis, TradingState
+from .trading_graph import (
+    create_trading_graph,
+    get_trading_graph,
+    get_resumable_trading_graph,
+    can_resume,
+    run_trading_analysis,
+    arun_trading_analysis,
+    run_trading_analysis_batch,
+    arun_trading_analysis_batch,
+    TradingState,
+)
 
-__all__ = ["create_trading_graph", "run_trading_analysis", "TradingState"]
+__all__ = [
+    "create_trading_graph",
+    "get_trading_graph",
+    "get_resumable_trading_graph",
+    "can_resume",
+    "run_trading_analysis",
+    "arun_trading_analysis",
+    "run_trading_analysis_batch",
+    "arun_trading_analysis_batch",
+    "TradingState",
+]
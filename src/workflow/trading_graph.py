@@ -2,10 +2,16 @@
 交易智能体 LangGraph 工作流
 使用 LangGraph 实现并行数据采集和状态管理
 """
-from typing import TypedDict, Optional, Dict, Any, List, Annotated
-from langgraph.graph import StateGraph, END
+from typing import TypedDict, Optional, Dict, Any, List, Annotated, Callable
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
+from langgraph.checkpoint.memory import InMemorySaver
 from loguru import logger
-import operator
+from pathlib import Path
+import asyncio
+import hashlib
+import threading
+import time
 
 from src.data_collectors.funding_rate import FundingRateCollector
 from src.data_collectors.kline_volume import KlineVolumeCollector
@@ -14,161 +20,264 @@ from src.data_collectors.news_sentiment import NewsSentimentCollector
 from src.analyzers.factor_analyzer import FactorAnalyzer
 from src.analyzers.market_signal_detector import MarketSignalDetector
 from src.agent.trading_agent import TradingAgent
+from src.utils.cache import TTLCache
+from config.settings import settings
+
+
+# 日志分隔线
+_BANNER = "=" * 70
+
+
+def _merge_errors(existing: List[str], new: List[str]) -> List[str]:
+    """
+    errors 字段的合并函数
+
+    大多数节点返回空列表，此时直接沿用原列表，不再复制；
+    有新错误时才拼接出新列表，不原地修改（旧列表可能仍被 LangGraph 的快照引用）。
+    """
+    return existing + new if new else existing
 
 
 class TradingState(TypedDict):
     """交易分析状态"""
     symbol: str
     verbose: bool
+    force_refresh: bool  # 为 True 时忽略采集结果缓存，重新采集
 
-    # 数据采集结果
-    funding_rate: Optional[Dict[str, Any]]
-    kline_volume: Optional[Dict[str, Any]]
-    liquidation: Optional[Dict[str, Any]]
-    news_sentiment: Optional[Dict[str, Any]]
+    # 数据采集结果（初始为空字典，采集失败时保持为空）
+    funding_rate: Dict[str, Any]
+    kline_volume: Dict[str, Any]
+    liquidation: Dict[str, Any]
+    news_sentiment: Dict[str, Any]
 
     # 行情预判结果
     has_trading_opportunity: Optional[bool]
     signal_summary: Optional[str]
+    triggered_signals: Optional[List[str]]
 
     # 处理结果
     formatted_data: Optional[str]
     analysis_result: Optional[str]
 
     # 错误追踪 - 使用 Annotated 支持并行更新
-    errors: Annotated[List[str], operator.add]
+    errors: Annotated[List[str], _merge_errors]
+
+
+# ============ 共享组件 ============
+
+# 采集器、分析器和智能体不保存单次分析的状态，在多次分析间复用，
+# 避免每次运行都重新创建 Binance 客户端、HTTP 连接和 LLM 客户端。
+# 首次使用时才创建（Binance 客户端创建时会请求接口），创建失败不缓存，下次重试
+_components: Dict[type, Any] = {}
+_components_lock = threading.Lock()
+
+
+def _get_component(cls):
+    """获取 cls 的共享实例"""
+    component = _components.get(cls)
+    if component is None:
+        with _components_lock:
+            component = _components.get(cls)
+            if component is None:
+                component = _components[cls] = cls()
+    return component
+
+
+# ============ 采集结果缓存 ============
+
+# 同一交易对在有效期内重复分析时直接复用采集结果，减少对交易所和新闻接口的请求。
+# 有效期按各数据的更新频率分别设置，0 表示不缓存
+_collect_cache = TTLCache(maxsize=256, ttl=60)
+_COLLECT_CACHE_TTLS = {
+    "funding_rate": settings.FUNDING_RATE_CACHE_TTL,
+    "kline_volume": settings.KLINE_CACHE_TTL,
+    "liquidation": settings.LIQUIDATION_CACHE_TTL,
+    "news_sentiment": settings.NEWS_CACHE_TTL,
+}
+
+
+async def _collect_cached(name: str, collector, symbol: str, force_refresh: bool = False) -> Dict[str, Any]:
+    """
+    采集数据，有效期内的结果直接从缓存返回
+
+    只缓存成功的结果；标记为 data_available=False 的降级数据不缓存，下次重新采集。
+    force_refresh 为 True 时跳过缓存重新采集，并用新结果更新缓存。
+    """
+    key = (name, symbol)
+    if not force_refresh:
+        data = _collect_cache.get(key)
+        if data is not None:
+            logger.debug(f"使用缓存的采集结果: {name} {symbol}")
+            return data
+
+    data = await collector.acollect(symbol)
+
+    ttl = _COLLECT_CACHE_TTLS[name]
+    if ttl > 0 and data and data.get("data_available", True):
+        _collect_cache.set(key, data, ttl=ttl)
+    return data
 
 
 # ============ 数据采集节点 ============
 
-def collect_funding_rate_node(state: TradingState) -> Dict[str, Any]:
+def _log_decision_info(state: TradingState, build_lines: Callable[[], List[str]]):
+    """
+    把采集节点的决策信息合并为一条日志输出（verbose 时为 INFO，否则为 DEBUG）
+
+    build_lines 只在该级别的日志会被输出时才调用，日志被过滤时不做任何字符串格式化。
+    """
+    logger.opt(lazy=True, depth=1).log(
+        "INFO" if state["verbose"] else "DEBUG", "{}", lambda: "\n".join(build_lines())
+    )
+
+
+async def collect_funding_rate_node(state: TradingState) -> Dict[str, Any]:
     """采集资金费率数据节点"""
     logger.info("节点: 采集资金费率数据")
     try:
-        collector = FundingRateCollector()
-        data = collector.collect(state["symbol"])
+        collector = _get_component(FundingRateCollector)
+        data = await _collect_cached(
+            "funding_rate", collector, state["symbol"], state["force_refresh"]
+        )
 
         # 打印关键决策信息
         if data:
-            logger.debug(f"【资金费率决策信息】")
-            logger.debug(f"  当前费率: {data.get('current_rate', 'N/A'):.4%}")
-            logger.debug(f"  24h平均: {data.get('avg_rate_24h', 'N/A'):.4%}")
-            logger.debug(f"  趋势: {data.get('trend', 'N/A')}")
-            logger.debug(f"  是否极端: {data.get('is_extreme', False)}")
-            logger.debug(f"  信号: {data.get('signal', 'N/A')}")
+            _log_decision_info(state, lambda: [
+                "【资金费率决策信息】",
+                f"  当前费率: {data.get('current_rate', 'N/A'):.4%}",
+                f"  24h平均: {data.get('avg_rate_24h', 'N/A'):.4%}",
+                f"  趋势: {data.get('trend', 'N/A')}",
+                f"  是否极端: {data.get('is_extreme', False)}",
+                f"  信号: {data.get('signal', 'N/A')}",
+            ])
 
         logger.info("✓ 资金费率数据采集完成")
         return {"funding_rate": data, "errors": []}
     except Exception as e:
         error_msg = f"资金费率采集失败: {str(e)}"
         logger.error(error_msg)
-        return {"funding_rate": None, "errors": [error_msg]}
+        return {"funding_rate": {}, "errors": [error_msg]}
 
 
-def collect_kline_node(state: TradingState) -> Dict[str, Any]:
+async def collect_kline_node(state: TradingState) -> Dict[str, Any]:
     """采集K线数据节点"""
     logger.info("节点: 采集K线数据")
     try:
-        collector = KlineVolumeCollector()
-        data = collector.collect(state["symbol"])
+        collector = _get_component(KlineVolumeCollector)
+        data = await _collect_cached(
+            "kline_volume", collector, state["symbol"], state["force_refresh"]
+        )
 
         # 打印关键决策信息
         if data:
-            logger.debug(f"【K线数据决策信息】")
-            logger.debug(f"  当前价格: {data.get('current_price', 'N/A')}")
             price_change_pct = data.get('price_change_pct', 0)
             if isinstance(price_change_pct, (int, float)):
-                logger.debug(f"  24h涨跌幅: {price_change_pct:.2f}%")
-            else:
-                logger.debug(f"  24h涨跌幅: {price_change_pct}")
-            logger.debug(f"  价格趋势: {data.get('price_trend', 'N/A')}")
-            logger.debug(f"  成交量趋势: {data.get('volume_trend', 'N/A')}")
-            logger.debug(f"  成交量信号: {data.get('volume_signal', 'N/A')}")
+                price_change_pct = f"{price_change_pct:.2f}%"
+            _log_decision_info(state, lambda: [
+                "【K线数据决策信息】",
+                f"  当前价格: {data.get('current_price', 'N/A')}",
+                f"  24h涨跌幅: {price_change_pct}",
+                f"  价格趋势: {data.get('price_trend', 'N/A')}",
+                f"  成交量趋势: {data.get('volume_trend', 'N/A')}",
+                f"  成交量信号: {data.get('volume_signal', 'N/A')}",
+            ])
 
         logger.info("✓ K线数据采集完成")
         return {"kline_volume": data, "errors": []}
     except Exception as e:
         error_msg = f"K线数据采集失败: {str(e)}"
         logger.error(error_msg)
-        return {"kline_volume": None, "errors": [error_msg]}
+        return {"kline_volume": {}, "errors": [error_msg]}
 
 
-def collect_liquidation_node(state: TradingState) -> Dict[str, Any]:
+async def collect_liquidation_node(state: TradingState) -> Dict[str, Any]:
     """采集市场压力数据节点"""
     logger.info("节点: 采集市场压力数据")
     try:
-        collector = LiquidationCollector()
-        data = collector.collect(state["symbol"])
+        collector = _get_component(LiquidationCollector)
+        data = await _collect_cached(
+            "liquidation", collector, state["symbol"], state["force_refresh"]
+        )
 
         # 打印关键决策信息
         if data and data.get('data_available'):
-            logger.debug(f"【市场压力数据决策信息】")
-            logger.debug(f"  持仓量: {data.get('open_interest', 'N/A')}")
-            logger.debug(f"  多空比: {data.get('long_short_ratio', 'N/A')}")
-            logger.debug(f"  多头占比: {data.get('long_account_pct', 'N/A'):.1f}%")
-            logger.debug(f"  空头占比: {data.get('short_account_pct', 'N/A'):.1f}%")
-            logger.debug(f"  买卖比: {data.get('buy_sell_ratio', 'N/A')}")
-            logger.debug(f"  风险等级: {data.get('risk_level', 'N/A')}")
-            logger.debug(f"  信号: {data.get('signal', 'N/A')}")
+            _log_decision_info(state, lambda: [
+                "【市场压力数据决策信息】",
+                f"  持仓量: {data.get('open_interest', 'N/A')}",
+                f"  多空比: {data.get('long_short_ratio', 'N/A')}",
+                f"  多头占比: {data.get('long_account_pct', 'N/A'):.1f}%",
+                f"  空头占比: {data.get('short_account_pct', 'N/A'):.1f}%",
+                f"  买卖比: {data.get('buy_sell_ratio', 'N/A')}",
+                f"  风险等级: {data.get('risk_level', 'N/A')}",
+                f"  信号: {data.get('signal', 'N/A')}",
+            ])
         else:
-            logger.debug(f"【市场压力数据决策信息】无可用数据")
+            _log_decision_info(state, lambda: ["【市场压力数据决策信息】无可用数据"])
 
         logger.info("✓ 市场压力数据采集完成")
         return {"liquidation": data, "errors": []}
     except Exception as e:
         error_msg = f"市场压力数据采集失败: {str(e)}"
         logger.error(error_msg)
-        return {"liquidation": None, "errors": [error_msg]}
-
-
-def collect_news_node(state: TradingState) -> Dict[str, Any]:
+        return {"liquidation": {}, "errors": [error_msg]}
+
+
+def _news_decision_lines(data: Dict[str, Any]) -> List[str]:
+    """消息面数据的决策信息（新闻标题截断到 80 字符）"""
+    lines = ["【消息面数据决策信息】"]
+
+    # 加密货币新闻
+    crypto_news = data.get('crypto_news', {})
+    news_list = crypto_news.get('news_list', [])
+    lines.append(f"  加密货币新闻: {len(news_list)} 条")
+    if news_list:
+        lines.append("  最新新闻标题:")
+        for i, news in enumerate(news_list[:3], 1):  # 只显示前3条
+            title = news.get('title', 'N/A')
+            sentiment = news.get('sentiment', 'N/A')
+            lines.append(f"    {i}. [{sentiment}] {title[:80]}{'...' if len(title) > 80 else ''}")
+
+    # 社交媒体情绪
+    lines.append(f"  社交媒体情绪: {data.get('social_sentiment', {}).get('sentiment', 'N/A')}")
+
+    # 宏观新闻
+    macro_news = data.get('macro_news', {})
+    macro_list = macro_news.get('news_list', [])
+    lines.append(f"  宏观新闻: {len(macro_list)} 条")
+    if macro_list:
+        lines.append("  最新宏观新闻:")
+        for i, news in enumerate(macro_list[:2], 1):  # 只显示前2条
+            title = news.get('title', 'N/A')
+            lines.append(f"    {i}. {title[:80]}{'...' if len(title) > 80 else ''}")
+
+    # 整体情绪
+    overall = data.get('overall_sentiment', {})
+    lines.append(f"  整体情绪: {overall.get('sentiment', 'N/A')} (得分: {overall.get('score', 0):.2f})")
+    lines.append(f"  信号: {overall.get('signal', 'N/A')}")
+    return lines
+
+
+async def collect_news_node(state: TradingState) -> Dict[str, Any]:
     """采集消息面数据节点"""
     logger.info("节点: 采集消息面数据")
     try:
-        collector = NewsSentimentCollector()
-        data = collector.collect(state["symbol"])
+        collector = _get_component(NewsSentimentCollector)
+        data = await _collect_cached(
+            "news_sentiment", collector, state["symbol"], state["force_refresh"]
+        )
 
         # 打印关键决策信息
         if data and data.get('data_available'):
-            logger.debug(f"【消息面数据决策信息】")
-
-            # 打印加密货币新闻
-            crypto_news = data.get('crypto_news', {})
-            news_list = crypto_news.get('news_list', [])
-            logger.debug(f"  加密货币新闻: {len(news_list)} 条")
-            if news_list:
-                logger.debug(f"  最新新闻标题:")
-                for i, news in enumerate(news_list[:3], 1):  # 只显示前3条
-                    title = news.get('title', 'N/A')
-                    sentiment = news.get('sentiment', 'N/A')
-                    logger.debug(f"    {i}. [{sentiment}] {title[:80]}{'...' if len(title) > 80 else ''}")
-
-            # 打印社交媒体情绪
-            logger.debug(f"  社交媒体情绪: {data.get('social_sentiment', {}).get('sentiment', 'N/A')}")
-
-            # 打印宏观新闻
-            macro_news = data.get('macro_news', {})
-            macro_list = macro_news.get('news_list', [])
-            logger.debug(f"  宏观新闻: {len(macro_list)} 条")
-            if macro_list:
-                logger.debug(f"  最新宏观新闻:")
-                for i, news in enumerate(macro_list[:2], 1):  # 只显示前2条
-                    title = news.get('title', 'N/A')
-                    logger.debug(f"    {i}. {title[:80]}{'...' if len(title) > 80 else ''}")
-
-            # 打印整体情绪
-            overall = data.get('overall_sentiment', {})
-            logger.debug(f"  整体情绪: {overall.get('sentiment', 'N/A')} (得分: {overall.get('score', 0):.2f})")
-            logger.debug(f"  信号: {overall.get('signal', 'N/A')}")
+            _log_decision_info(state, lambda: _news_decision_lines(data))
         else:
-            logger.debug(f"【消息面数据决策信息】无可用数据（需要配置API密钥）")
+            _log_decision_info(state, lambda: ["【消息面数据决策信息】无可用数据（需要配置API密钥）"])
 
         logger.info("✓ 消息面数据采集完成")
         return {"news_sentiment": data, "errors": []}
     except Exception as e:
         error_msg = f"消息面数据采集失败: {str(e)}"
         logger.error(error_msg)
-        return {"news_sentiment": None, "errors": [error_msg]}
+        return {"news_sentiment": {}, "errors": [error_msg]}
 
 
 # ============ 数据处理节点 ============
@@ -179,22 +288,23 @@ def market_signal_detection_node(state: TradingState) -> Dict[str, Any]:
     try:
         # 检查是否有关键数据
         if not state["funding_rate"] or not state["kline_volume"]:
-            logger.warning("缺少关键数据，跳过行情预判")
+            logger.warning("缺少关键数据，跳过行情预判和AI分析")
+            # 工作流在此结束，未经分析不能判定为有交易机会
             return {
-                "has_trading_opportunity": True,
-                "signal_summary": "数据不足，默认进行AI分析",
+                "has_trading_opportunity": False,
+                "signal_summary": "数据不足，无法分析",
                 "errors": [],
             }
 
-        # 创建信号检测器
-        detector = MarketSignalDetector()
+        # 信号检测器（共享实例）
+        detector = _get_component(MarketSignalDetector)
 
         # 检测交易机会
         has_opportunity, signals, signal_details = detector.detect_trading_opportunity(
             funding_rate=state["funding_rate"],
             kline_volume=state["kline_volume"],
-            liquidation=state["liquidation"] or {},
-            news_sentiment=state["news_sentiment"] or {},
+            liquidation=state["liquidation"],
+            news_sentiment=state["news_sentiment"],
         )
 
         # 格式化信号摘要
@@ -203,7 +313,7 @@ def market_signal_detection_node(state: TradingState) -> Dict[str, Any]:
         )
 
         # 打印预判结果
-        logger.info("=" * 70)
+        logger.info(_BANNER)
         logger.info("【行情预判结果】")
         logger.info(f"  是否有交易机会: {'是' if has_opportunity else '否'}")
         logger.info(f"  触发信号数: {len(signals)}")
@@ -211,19 +321,23 @@ def market_signal_detection_node(state: TradingState) -> Dict[str, Any]:
             logger.info(f"  触发信号:")
             for signal in signals:
                 logger.info(f"    • {signal}")
-        logger.info("=" * 70)
+        logger.info(_BANNER)
 
-        if not has_opportunity:
-            logger.info("⏭️  未检测到明显交易机会，跳过AI分析")
-        else:
-            logger.info("✅ 检测到交易机会，将进行AI分析")
-
-        return {
+        result = {
             "has_trading_opportunity": has_opportunity,
             "signal_summary": signal_summary,
             "triggered_signals": signals,  # 添加触发的信号列表
             "errors": [],
         }
+
+        if not has_opportunity:
+            # 无交易机会时工作流在此结束，直接给出分析结论，不再格式化数据和调用LLM
+            logger.info("⏭️  未检测到明显交易机会，跳过AI分析")
+            result["analysis_result"] = f"【无需分析】\n{signal_summary}"
+        else:
+            logger.info("✅ 检测到交易机会，将进行AI分析")
+
+        return result
     except Exception as e:
         error_msg = f"行情预判失败: {str(e)}"
         logger.error(error_msg)
@@ -248,12 +362,12 @@ def format_data_node(state: TradingState) -> Dict[str, Any]:
             "symbol": state["symbol"],
             "funding_rate": state["funding_rate"],
             "kline_volume": state["kline_volume"],
-            "liquidation": state["liquidation"] or {},
-            "news_sentiment": state["news_sentiment"] or {},
+            "liquidation": state["liquidation"],
+            "news_sentiment": state["news_sentiment"],
         }
 
         # 格式化为LLM可读文本
-        analyzer = FactorAnalyzer()
+        analyzer = _get_component(FactorAnalyzer)
         formatted_text = analyzer.format_for_llm(analysis_data)
 
         # 打印格式化摘要
@@ -278,35 +392,19 @@ def ai_analysis_node(state: TradingState) -> Dict[str, Any]:
     """AI分析节点"""
     logger.info("节点: AI分析")
     try:
-        # 检查是否有交易机会
-        if not state.get("has_trading_opportunity", True):
-            logger.info("⏭️  无交易机会，跳过AI分析")
-            return {
-                "analysis_result": f"【无需分析】\n{state.get('signal_summary', '未检测到明显交易机会')}",
-                "errors": [],
-            }
-
         if not state["formatted_data"]:
             raise ValueError("没有可用的格式化数据")
 
-        agent = TradingAgent()
+        agent = _get_component(TradingAgent)
         result = agent.analyze(state["formatted_data"])
 
         # 在AI分析结果前添加采集数据摘要
         data_summary = _build_data_summary(state)
         full_result = f"{data_summary}\n\n{result}"
 
-        # 打印AI分析决策摘要
-        logger.info(f"【AI分析决策完成】")
-        logger.info(f"  分析结果长度: {len(full_result)} 字符")
-
-        # 提取关键决策信息（如果结果中包含）
-        if full_result:
-            # 记录完整的AI分析结果到日志文件
-            logger.info("=" * 70)
-            logger.info("【完整AI分析结果】")
-            logger.info(full_result)
-            logger.info("=" * 70)
+        # 日志只记录摘要，完整结果通过状态返回，随分析记录保存到数据库
+        digest = hashlib.md5(full_result.encode("utf-8")).hexdigest()[:8]
+        logger.info(f"【AI分析决策完成】{len(full_result)} 字符, digest={digest}")
 
         logger.info("✓ AI分析完成")
         return {"analysis_result": full_result, "errors": []}
@@ -318,7 +416,7 @@ def ai_analysis_node(state: TradingState) -> Dict[str, Any]:
 
 def _build_data_summary(state: TradingState) -> str:
     """构建采集数据摘要"""
-    lines = ["=" * 70, "【市场数据摘要】", ""]
+    lines = [_BANNER, "【市场数据摘要】", ""]
 
     # K线数据
     kline_data = state.get('kline_volume', {})
@@ -375,14 +473,37 @@ def _build_data_summary(state: TradingState) -> str:
     if triggered_signals:
         lines.append(f"触发信号: {', '.join(triggered_signals)}")
 
-    lines.append("=" * 70)
+    lines.append(_BANNER)
     return "\n".join(lines)
 
 
+# ============ 条件路由 ============
+
+def _route_after_signal_detection(state: TradingState) -> str:
+    """行情预判后的路由：缺少资金费率或K线数据、或没有交易机会时结束工作流"""
+    if not state["funding_rate"] or not state["kline_volume"]:
+        return "end"
+    if not state["has_trading_opportunity"]:
+        return "end"
+    return "format_data"
+
+
+def _route_after_format(state: TradingState) -> str:
+    """格式化后的路由：没有格式化数据时结束工作流"""
+    if state["formatted_data"] is None:
+        return "end"
+    return "ai_analysis"
+
+
 # ============ 构建工作流图 ============
 
-def create_trading_graph():
-    """创建交易分析工作流图"""
+def create_trading_graph(checkpointer=None):
+    """
+    创建交易分析工作流图
+
+    Args:
+        checkpointer: 检查点存储，为空时不保存中间状态
+    """
 
     # 创建状态图
     workflow = StateGraph(TradingState)
@@ -410,74 +531,156 @@ def create_trading_graph():
     workflow.add_edge("collect_liquidation", "market_signal_detection")
     workflow.add_edge("collect_news", "market_signal_detection")
 
-    # 行情预判完成后，进入格式化节点
-    workflow.add_edge("market_signal_detection", "format_data")
+    # 行情预判完成后，关键数据齐全且有交易机会才进入格式化节点，否则直接结束
+    workflow.add_conditional_edges(
+        "market_signal_detection",
+        _route_after_signal_detection,
+        {"format_data": "format_data", "end": END},
+    )
 
-    # 格式化完成后，进入AI分析
-    workflow.add_edge("format_data", "ai_analysis")
+    # 格式化成功后进入AI分析，失败则直接结束，不调用LLM
+    workflow.add_conditional_edges(
+        "format_data",
+        _route_after_format,
+        {"ai_analysis": "ai_analysis", "end": END},
+    )
 
     # AI分析完成后，结束
     workflow.add_edge("ai_analysis", END)
 
     # 编译工作流
-    app = workflow.compile()
+    app = workflow.compile(checkpointer=checkpointer)
 
     return app
 
 
-def run_trading_analysis(symbol: str, verbose: bool = False) -> Dict[str, Any]:
-    """
-    运行交易分析工作流
+# ============ 检查点 ============
 
-    Args:
-        symbol: 交易对符号 (如 BTCUSDT)
-        verbose: 是否输出详细信息
+# 只有调用方传入运行 ID 时才保存检查点（按「交易对:运行 ID」区分），常规运行不付出保存状态的开销。
+# AI分析失败时保留该运行的检查点，调用方用同一运行 ID 再次分析时直接从AI分析继续，
+# 不再重新采集数据；分析成功后删除，未被续跑的检查点超过保留时间后删除，避免内存持续增长
+_checkpointer = InMemorySaver()
+CHECKPOINT_TTL_SECONDS = 600
+_resumable_threads: Dict[str, float] = {}
+_resumable_lock = threading.Lock()
 
-    Returns:
-        包含分析结果的字典
-    """
-    logger.info(f"启动 LangGraph 工作流分析: {symbol}")
 
-    # 创建工作流
-    app = create_trading_graph()
+def _checkpoint_thread_id(symbol: str, run_id: str) -> str:
+    """检查点的线程 ID"""
+    return f"{symbol}:{run_id}"
 
-    # 生成并保存工作流图像
+
+def _release_checkpoint(thread_id: str, resumable: bool):
+    """运行结束后处理检查点：可续跑的保留，其余删除，并清理过期的检查点"""
+    now = time.monotonic()
+    with _resumable_lock:
+        expired = [
+            tid for tid, saved_at in _resumable_threads.items()
+            if now - saved_at > CHECKPOINT_TTL_SECONDS
+        ]
+        for tid in expired:
+            del _resumable_threads[tid]
+        if resumable:
+            _resumable_threads[thread_id] = now
+        else:
+            _resumable_threads.pop(thread_id, None)
+            expired.append(thread_id)
+    for tid in expired:
+        _checkpointer.delete_thread(tid)
+
+
+def can_resume(state: Optional[Dict[str, Any]]) -> bool:
+    """已完成数据格式化、但AI分析没有结果的运行可以从AI分析继续"""
+    return bool(state) and bool(state.get("formatted_data")) and not state.get("analysis_result")
+
+
+# 编译后的工作流不保存单次运行的状态（检查点按运行 ID 分开存放），可在多次分析、多个线程间复用
+_app = None
+_resumable_app = None
+_app_lock = threading.Lock()
+
+
+def get_trading_graph():
+    """获取编译好的工作流（首次调用时创建并缓存），不保存检查点"""
+    global _app
+    if _app is None:
+        with _app_lock:
+            if _app is None:
+                _app = create_trading_graph()
+    return _app
+
+
+def get_resumable_trading_graph():
+    """获取保存检查点的工作流（首次调用时创建并缓存），用于可续跑的运行"""
+    global _resumable_app
+    if _resumable_app is None:
+        with _app_lock:
+            if _resumable_app is None:
+                _resumable_app = create_trading_graph(checkpointer=_checkpointer)
+    return _resumable_app
+
+
+_graph_logged = False
+_graph_dumped = False
+
+
+# 工作流结构说明（导入时拼接一次）
+_WORKFLOW_STRUCTURE_TEXT = "\n".join([
+    _BANNER,
+    "【LangGraph 工作流结构】",
+    "",
+    "入口节点（并行执行）:",
+    "  ├─ collect_funding_rate  (采集资金费率)",
+    "  ├─ collect_kline         (采集K线数据)",
+    "  ├─ collect_liquidation   (采集市场压力数据)",
+    "  └─ collect_news          (采集消息面数据)",
+    "",
+    "数据处理节点:",
+    "  ├─ market_signal_detection (行情预判)",
+    "  ├─ format_data             (格式化数据)",
+    "  └─ ai_analysis             (AI分析)",
+    "",
+    "工作流执行顺序:",
+    "  [并行] 4个数据采集节点同时执行",
+    "  ↓",
+    "  [等待] 所有采集完成后进入行情预判",
+    "  ↓",
+    "  [串行] 行情预判 → 格式化数据 → AI分析 → 结束",
+    "  注: 若缺少关键数据或无交易机会，行情预判后直接结束",
+    _BANNER,
+])
+
+
+def log_graph_structure():
+    """输出工作流结构（每个进程只输出一次）"""
+    global _graph_logged
+    with _app_lock:
+        if _graph_logged:
+            return
+        _graph_logged = True
+
+    logger.info(_WORKFLOW_STRUCTURE_TEXT)
+
+
+def dump_workflow_graph(app, out_dir: str = "logs"):
+    """
+    输出工作流 ASCII 图，并把 Mermaid 图保存到 out_dir
+
+    Args:
+        app: 编译好的工作流
+        out_dir: Mermaid 图的保存目录
+    """
     try:
-        from pathlib import Path
-        graph_output_dir = Path("logs")
+        graph_output_dir = Path(out_dir)
         graph_output_dir.mkdir(exist_ok=True)
 
-        # 打印工作流结构（文本形式）
-        logger.info("=" * 70)
-        logger.info("【LangGraph 工作流结构】")
-        logger.info("")
-        logger.info("入口节点（并行执行）:")
-        logger.info("  ├─ collect_funding_rate  (采集资金费率)")
-        logger.info("  ├─ collect_kline         (采集K线数据)")
-        logger.info("  ├─ collect_liquidation   (采集市场压力数据)")
-        logger.info("  └─ collect_news          (采集消息面数据)")
-        logger.info("")
-        logger.info("数据处理节点:")
-        logger.info("  ├─ market_signal_detection (行情预判)")
-        logger.info("  ├─ format_data             (格式化数据)")
-        logger.info("  └─ ai_analysis             (AI分析)")
-        logger.info("")
-        logger.info("工作流执行顺序:")
-        logger.info("  [并行] 4个数据采集节点同时执行")
-        logger.info("  ↓")
-        logger.info("  [等待] 所有采集完成后进入行情预判")
-        logger.info("  ↓")
-        logger.info("  [串行] 行情预判 → 格式化数据 → AI分析 → 结束")
-        logger.info("  注: 若无交易机会，AI分析将被跳过")
-        logger.info("=" * 70)
-
         # 尝试生成 ASCII 图
         try:
             graph_ascii = app.get_graph().draw_ascii()
             logger.info("")
             logger.info("【LangGraph ASCII 图】")
             logger.info(graph_ascii)
-            logger.info("=" * 70)
+            logger.info(_BANNER)
         except Exception as e:
             logger.debug(f"无法生成 ASCII 图: {e}")
 
@@ -494,24 +697,81 @@ def run_trading_analysis(symbol: str, verbose: bool = False) -> Dict[str, Any]:
     except Exception as e:
         logger.warning(f"无法生成工作流图: {e}")
 
+
+def run_trading_analysis(
+    symbol: str, verbose: bool = False, force_refresh: bool = False, run_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    运行交易分析工作流（同步入口，在新的事件循环中执行 arun_trading_analysis）
+
+    Args:
+        symbol: 交易对符号 (如 BTCUSDT)
+        verbose: 是否输出详细信息
+        force_refresh: 是否忽略采集结果缓存，重新采集全部数据
+        run_id: 运行 ID，见 arun_trading_analysis
+
+    Returns:
+        包含分析结果的字典
+    """
+    return asyncio.run(arun_trading_analysis(symbol, verbose, force_refresh, run_id))
+
+
+async def arun_trading_analysis(
+    symbol: str, verbose: bool = False, force_refresh: bool = False, run_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    异步运行交易分析工作流，4个数据采集节点在同一事件循环中并发执行
+
+    Args:
+        symbol: 交易对符号 (如 BTCUSDT)
+        verbose: 是否输出详细信息
+        force_refresh: 是否忽略采集结果缓存，重新采集全部数据
+        run_id: 运行 ID。传入时保存检查点，AI分析失败后（can_resume 为真）
+            用同一运行 ID 再次调用会复用已采集的数据，从AI分析继续
+
+    Returns:
+        包含分析结果的字典
+    """
+    logger.info(f"启动 LangGraph 工作流分析: {symbol}")
+
+    # 获取工作流（整个进程只编译一次），只有传入运行 ID 时才使用保存检查点的工作流
+    app = get_trading_graph() if run_id is None else get_resumable_trading_graph()
+
+    # 输出工作流结构（每个进程只输出一次）
+    log_graph_structure()
+
+    # 详细模式下生成工作流图（每个进程只生成一次，不影响常规运行）
+    global _graph_dumped
+    if verbose and not _graph_dumped:
+        with _app_lock:
+            dump = not _graph_dumped
+            _graph_dumped = True
+        if dump:
+            dump_workflow_graph(app, "logs")
+
     # 初始化状态
     initial_state: TradingState = {
         "symbol": symbol,
         "verbose": verbose,
-        "funding_rate": None,
-        "kline_volume": None,
-        "liquidation": None,
-        "news_sentiment": None,
+        "force_refresh": force_refresh,
+        "funding_rate": {},
+        "kline_volume": {},
+        "liquidation": {},
+        "news_sentiment": {},
         "has_trading_opportunity": None,
         "signal_summary": None,
+        "triggered_signals": None,
         "formatted_data": None,
         "analysis_result": None,
         "errors": [],
     }
 
     # 执行工作流
-    logger.info("开始执行工作流...")
-    final_state = app.invoke(initial_state)
+    if run_id is None:
+        logger.info("开始执行工作流...")
+        final_state = await app.ainvoke(initial_state)
+    else:
+        final_state = await _ainvoke_resumable(app, symbol, run_id, initial_state)
 
     # 检查错误
     if final_state["errors"]:
@@ -522,3 +782,137 @@ def run_trading_analysis(symbol: str, verbose: bool = False) -> Dict[str, Any]:
     logger.info("工作流执行完成")
 
     return final_state
+
+
+async def _ainvoke_resumable(app, symbol: str, run_id: str, initial_state: TradingState) -> Dict[str, Any]:
+    """按运行 ID 执行工作流：该运行AI分析失败过的，复用已采集的数据从AI分析继续"""
+    thread_id = _checkpoint_thread_id(symbol, run_id)
+    config = {"configurable": {"thread_id": thread_id}}
+    snapshot = await app.aget_state(config)
+    resumable = False
+    try:
+        if not initial_state["force_refresh"] and can_resume(snapshot.values):
+            logger.info(f"复用已采集的数据，从AI分析继续: {thread_id}")
+            await app.aupdate_state(config, {"verbose": initial_state["verbose"]}, as_node="format_data")
+            final_state = await app.ainvoke(None, config)
+        else:
+            # 全新运行前删除该运行的旧检查点，避免旧运行的错误等状态合并到本次结果中
+            _checkpointer.delete_thread(thread_id)
+            logger.info("开始执行工作流...")
+            final_state = await app.ainvoke(initial_state, config)
+        resumable = can_resume(final_state)
+    finally:
+        # 运行异常时也要清理检查点，避免残留
+        _release_checkpoint(thread_id, resumable)
+    return final_state
+
+
+# ============ 批量分析 ============
+
+def _merge_results(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """results 字段的合并函数：汇总各交易对分支返回的结果"""
+    return {**existing, **new}
+
+
+class BatchState(TypedDict):
+    """批量分析状态"""
+    symbols: List[str]
+    verbose: bool
+    force_refresh: bool
+    run_id: Optional[str]
+
+    # 各交易对的最终状态，分析失败时为 None
+    results: Annotated[Dict[str, Any], _merge_results]
+
+
+def _dispatch_symbols(state: BatchState) -> List[Send]:
+    """为每个交易对派发一个分析分支（并行执行）"""
+    return [
+        Send("analyze_symbol", {
+            "symbol": symbol,
+            "verbose": state["verbose"],
+            "force_refresh": state["force_refresh"],
+            "run_id": state["run_id"],
+        })
+        for symbol in state["symbols"]
+    ]
+
+
+async def analyze_symbol_node(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """批量分析中的单个交易对分支，运行完整的分析工作流"""
+    symbol = payload["symbol"]
+    try:
+        final_state = await arun_trading_analysis(
+            symbol, payload["verbose"], payload["force_refresh"], payload["run_id"]
+        )
+    except Exception as e:
+        logger.error(f"分析 {symbol} 时出错: {e}")
+        final_state = None
+    return {"results": {symbol: final_state}}
+
+
+def create_batch_graph():
+    """创建批量分析工作流图：每个交易对一个并行分支"""
+    workflow = StateGraph(BatchState)
+    workflow.add_node("analyze_symbol", analyze_symbol_node)
+    workflow.add_conditional_edges(START, _dispatch_symbols, ["analyze_symbol"])
+    workflow.add_edge("analyze_symbol", END)
+    return workflow.compile()
+
+
+_batch_app = None
+
+
+def get_batch_graph():
+    """获取编译好的批量分析工作流（首次调用时创建并缓存）"""
+    global _batch_app
+    if _batch_app is None:
+        with _app_lock:
+            if _batch_app is None:
+                _batch_app = create_batch_graph()
+    return _batch_app
+
+
+async def arun_trading_analysis_batch(
+    symbols: List[str],
+    verbose: bool = False,
+    force_refresh: bool = False,
+    max_concurrency: Optional[int] = None,
+    run_id: Optional[str] = None,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    在一次工作流调用中并行分析多个交易对
+
+    Args:
+        symbols: 交易对列表（重复的交易对只分析一次）
+        verbose: 是否输出详细信息
+        force_refresh: 是否忽略采集结果缓存，重新采集全部数据
+        max_concurrency: 同时运行的交易对分支数上限，为空时不限制
+        run_id: 运行 ID，传给每个交易对的 arun_trading_analysis
+
+    Returns:
+        {交易对: 最终状态}，按 symbols 的顺序排列，分析出错的交易对为 None
+    """
+    symbols = list(dict.fromkeys(symbols))
+    app = get_batch_graph()
+    config = {"max_concurrency": max_concurrency} if max_concurrency else None
+    batch_state = await app.ainvoke(
+        {"symbols": symbols, "verbose": verbose, "force_refresh": force_refresh,
+         "run_id": run_id, "results": {}},
+        config=config,
+    )
+    results = batch_state["results"]
+    return {symbol: results.get(symbol) for symbol in symbols}
+
+
+def run_trading_analysis_batch(
+    symbols: List[str],
+    verbose: bool = False,
+    force_refresh: bool = False,
+    max_concurrency: Optional[int] = None,
+    run_id: Optional[str] = None,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """批量分析的同步入口，参数同 arun_trading_analysis_batch"""
+    return asyncio.run(
+        arun_trading_analysis_batch(symbols, verbose, force_refresh, max_concurrency, run_id)
+    )
@@ -0,0 +1,118 @@
+"""
+测试公共夹具
+用本地假数据替换采集器和智能体，工作流测试不访问交易所、新闻接口和 LLM
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import src.workflow.trading_graph as trading_graph  # noqa: E402
+from src.data_collectors.liquidation import LiquidationCollector  # noqa: E402
+from src.data_collectors.news_sentiment import NewsSentimentCollector  # noqa: E402
+
+
+FUNDING_DATA = {
+    "current_rate": 0.0009,
+    "max_rate_24h": 0.001,
+    "min_rate_24h": 0.0001,
+    "avg_rate_24h": 0.0004,
+    "trend": "上升",
+    "is_extreme": True,
+    "signal": "多头过热",
+    "rate_change": 0.0006,
+    "history": [0.0001] * 24,
+}
+
+KLINE_DATA = {
+    "current_price": 100.0,
+    "highest_price_24h": 110.0,
+    "lowest_price_24h": 90.0,
+    "price_change": 8.0,
+    "price_change_pct": 8.0,
+    "price_trend": "上升",
+    "support": 90.0,
+    "resistance": 110.0,
+    "avg_volume": 10.0,
+    "current_volume": 30.0,
+    "volume_trend": "放量",
+    "volume_signal": "放量上涨，趋势延续",
+    "prices": [92.0] * 23 + [100.0],
+    "volumes": [10.0] * 23 + [30.0],
+}
+
+
+class FakeCollector:
+    """返回固定数据的采集器，记录每个交易对的采集次数"""
+
+    data: dict = {}
+
+    def __init__(self):
+        self.calls = []
+
+    def collect(self, symbol):
+        self.calls.append(symbol)
+        return dict(self.data)
+
+    async def acollect(self, symbol):
+        return self.collect(symbol)
+
+
+class FakeFundingCollector(FakeCollector):
+    data = FUNDING_DATA
+
+
+class FakeKlineCollector(FakeCollector):
+    data = KLINE_DATA
+
+
+class FakeLiquidationCollector(FakeCollector):
+    data = LiquidationCollector._unavailable_result()
+
+
+class FakeNewsCollector(NewsSentimentCollector):
+    """未配置 API 密钥的消息面采集器，各数据源直接返回不可用的结果"""
+
+    def __init__(self):
+        super().__init__()
+        self.cryptocompare_api_key = None
+        self.newsapi_key = None
+
+
+class FakeAgent:
+    """假的交易智能体，fail_times 大于 0 时前几次调用抛出异常"""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail_times = 0
+
+    def analyze(self, market_data):
+        self.calls += 1
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("llm down")
+        return "【市场趋势判断】\n看多\n信心度: 70%"
+
+
+@pytest.fixture
+def workflow(monkeypatch, tmp_path):
+    """使用假组件、独立检查点和空缓存的工作流模块"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trading_graph, "FundingRateCollector", FakeFundingCollector)
+    monkeypatch.setattr(trading_graph, "KlineVolumeCollector", FakeKlineCollector)
+    monkeypatch.setattr(trading_graph, "LiquidationCollector", FakeLiquidationCollector)
+    monkeypatch.setattr(trading_graph, "NewsSentimentCollector", FakeNewsCollector)
+    monkeypatch.setattr(trading_graph, "TradingAgent", FakeAgent)
+    monkeypatch.setattr(trading_graph, "_components", {})
+    monkeypatch.setattr(trading_graph, "_collect_cache", trading_graph.TTLCache(maxsize=256, ttl=60))
+    monkeypatch.setattr(trading_graph, "_checkpointer", InMemorySaver())
+    monkeypatch.setattr(trading_graph, "_resumable_threads", {})
+    monkeypatch.setattr(trading_graph, "_app", None)
+    monkeypatch.setattr(trading_graph, "_resumable_app", None)
+    monkeypatch.setattr(trading_graph, "_batch_app", None)
+    return trading_graph
@@ -0,0 +1,67 @@
+"""
+准确率追踪测试：获取当前价格时不持有写事务，只在更新时开启写事务
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.analyzers.accuracy_tracker as accuracy_tracker_module
+from src.analyzers.accuracy_tracker import AccuracyTracker
+from src.database import init_database
+from src.database.models import AnalysisRecord, SignalPerformance
+
+
+class PriceCollector:
+    """返回固定价格，记录请求时共享写连接是否处于事务中"""
+
+    def __init__(self, db, price):
+        self.db = db
+        self.price = price
+        self.in_transaction = []
+
+    def collect(self, symbol):
+        self.in_transaction.append(self.db.conn is not None and self.db.conn.in_transaction)
+        return {"current_price": self.price}
+
+
+@pytest.fixture
+def tracker(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    init_database()
+    # 真实采集器初始化时会访问币安接口，测试中各自替换为 PriceCollector
+    monkeypatch.setattr(accuracy_tracker_module, "KlineVolumeCollector", lambda: None)
+    return AccuracyTracker()
+
+
+def _add_signal(tracker, trend, target_price, hours_ago):
+    analysis_id = AnalysisRecord.create(tracker.repo.db, {
+        "symbol": "BTCUSDT", "trend_direction": trend, "target_price": target_price,
+    })
+    return SignalPerformance.create(tracker.repo.db, analysis_id, "BTCUSDT", 100.0,
+                                    datetime.now() - timedelta(hours=hours_ago))
+
+
+def test_price_is_fetched_outside_write_transaction(tracker):
+    hit_id = _add_signal(tracker, "看多", 105.0, hours_ago=1)
+    open_id = _add_signal(tracker, "看多", 120.0, hours_ago=1)
+    collector = tracker.kline_collector = PriceCollector(tracker.repo.db, 110.0)
+
+    assert tracker.update_signal_performance("BTCUSDT") == 1
+
+    assert collector.in_transaction == [False]
+    with tracker.repo.read_db as conn:
+        rows = {row["id"]: row for row in conn.execute("SELECT * FROM signal_performance")}
+    assert rows[hit_id]["exit_price"] == 110.0
+    assert rows[hit_id]["hit_target"] == 1
+    assert rows[open_id]["exit_price"] is None
+
+
+def test_expired_short_signal_is_closed(tracker):
+    signal_id = _add_signal(tracker, "看空", None, hours_ago=30)
+    tracker.kline_collector = PriceCollector(tracker.repo.db, 90.0)
+
+    assert tracker.update_signal_performance("BTCUSDT", hours=48) == 1
+    with tracker.repo.read_db as conn:
+        row = conn.execute("SELECT * FROM signal_performance WHERE id = ?", (signal_id,)).fetchone()
+    assert row["is_profitable"] == 1
+    assert row["price_change_pct"] == pytest.approx(-10.0)
@@ -0,0 +1,44 @@
+"""
+AI分析结果测试：流式结果合并、完整结果只通过状态返回
+"""
+from pathlib import Path
+
+from langchain_core.messages import AIMessageChunk
+
+from src.agent.trading_agent import TradingAgent
+
+
+class FakeStreamingLLM:
+    """按块返回固定文本的 LLM"""
+
+    def __init__(self, parts):
+        self.parts = parts
+
+    def stream(self, messages):
+        for part in self.parts:
+            yield AIMessageChunk(content=part)
+
+
+def _agent_with_llm(llm):
+    agent = TradingAgent.__new__(TradingAgent)
+    agent.llm = llm
+    return agent
+
+
+def test_analyze_joins_streamed_chunks():
+    agent = _agent_with_llm(FakeStreamingLLM(["【市场趋势", "判断】\n", "看多"]))
+
+    assert agent.analyze("market data") == "【市场趋势判断】\n看多"
+
+
+def test_analyze_returns_empty_text_for_empty_stream():
+    agent = _agent_with_llm(FakeStreamingLLM([]))
+
+    assert agent.analyze("market data") == ""
+
+
+def test_full_result_is_returned_in_state_without_files(workflow):
+    state = workflow.run_trading_analysis("BTCUSDT")
+
+    assert state["analysis_result"].endswith("信心度: 70%")
+    assert not (Path(workflow.settings.LOG_DIR) / "ai_results").exists()
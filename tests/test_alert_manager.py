@@ -0,0 +1,216 @@
+"""
+告警管理器测试：webhook 请求只在确定未送达时重试、告警去重与合并发送、令牌桶限流
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import src.alerts.alert_manager as alert_manager_module
+from src.alerts.alert_manager import AlertManager, _TokenBucket
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """按预设的响应序列应答 POST 请求，"slow" 表示超过客户端超时时间才应答"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests += 1
+        status = self.server.responses.pop(0) if self.server.responses else 200
+        if status == "slow":
+            time.sleep(0.5)
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _WebhookHandler)
+    server.requests = 0
+    server.responses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/hook"
+
+
+def test_read_timeout_is_not_retried(webhook_server):
+    webhook_server.responses = ["slow"]
+    session = AlertManager._create_session()
+
+    with pytest.raises(requests.exceptions.RequestException):
+        session.post(_url(webhook_server), data=b"{}", timeout=0.2)
+
+    time.sleep(0.6)
+    assert webhook_server.requests == 1
+
+
+def test_unavailable_response_is_retried(webhook_server):
+    webhook_server.responses = [503, 200]
+    session = AlertManager._create_session()
+
+    response = session.post(_url(webhook_server), data=b"{}", timeout=2)
+
+    assert response.status_code == 200
+    assert webhook_server.requests == 2
+
+
+def test_server_error_is_not_retried(webhook_server):
+    webhook_server.responses = [500]
+    session = AlertManager._create_session()
+
+    response = session.post(_url(webhook_server), data=b"{}", timeout=2)
+
+    assert response.status_code == 500
+    assert webhook_server.requests == 1
+
+
+ALERT = {
+    "current_price": 100.0,
+    "price_change_24h": 1.5,
+    "trend_direction": "看多",
+    "confidence": 0.75,
+    "triggered_signals": ["价格大幅上涨", "成交量异常放大"],
+}
+
+
+@pytest.fixture
+def make_feishu_manager(monkeypatch):
+    """
+    创建启用飞书告警、不实际发送的告警管理器，manager.sent 记录每次发送的告警批次
+
+    合并窗口默认 60 秒：测试时间内不会到期，批次只由 feishu_batch_size 和 close() 决定
+    """
+    managers = []
+
+    def make(batch_window="60", batch_size="20"):
+        monkeypatch.setenv("FEISHU_WEBHOOK", "http://127.0.0.1:9/hook")
+        monkeypatch.setenv("FEISHU_BATCH_WINDOW", batch_window)
+        monkeypatch.setenv("FEISHU_BATCH_SIZE", batch_size)
+        sent = []
+        monkeypatch.setattr(AlertManager, "_send_feishu", lambda self, alerts: sent.append(alerts))
+        manager = AlertManager()
+        manager.sent = sent
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
+
+
+def _sent_symbols(manager):
+    return [[alert[0] for alert in batch] for batch in manager.sent]
+
+
+def test_alerts_within_window_are_sent_as_one_batch(make_feishu_manager):
+    manager = make_feishu_manager()
+    for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+        manager.send_alert(symbol, ALERT)
+    manager.close()
+
+    assert _sent_symbols(manager) == [["BTCUSDT", "ETHUSDT", "SOLUSDT"]]
+
+
+def test_batch_is_split_at_batch_size(make_feishu_manager):
+    manager = make_feishu_manager(batch_size="2")
+    for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+        manager.send_alert(symbol, ALERT)
+    manager.close()
+
+    assert _sent_symbols(manager) == [["BTCUSDT", "ETHUSDT"], ["SOLUSDT"]]
+
+
+def test_zero_window_sends_each_alert_separately(make_feishu_manager):
+    manager = make_feishu_manager(batch_window="0")
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        manager.send_alert(symbol, ALERT)
+    manager.close()
+
+    assert _sent_symbols(manager) == [["BTCUSDT"], ["ETHUSDT"]]
+
+
+def test_duplicate_alerts_are_skipped(make_feishu_manager):
+    manager = make_feishu_manager()
+    manager.send_alert("BTCUSDT", ALERT)
+    manager.send_alert("BTCUSDT", dict(ALERT))
+    manager.send_alert("BTCUSDT", {**ALERT, "trend_direction": "看空"})
+    manager.close()
+
+    sent_alerts = [alert for batch in manager.sent for alert in batch]
+    assert [alert[1]["trend_direction"] for alert in sent_alerts] == ["看多", "看空"]
+
+
+@pytest.mark.parametrize("post_card", [
+    lambda card, name: False,
+    lambda card, name: (_ for _ in ()).throw(requests.ConnectionError("down")),
+])
+def test_failed_delivery_forgets_dedup_key(monkeypatch, post_card):
+    monkeypatch.setenv("FEISHU_WEBHOOK", "http://127.0.0.1:9/hook")
+    monkeypatch.setenv("FEISHU_BATCH_WINDOW", "60")
+    monkeypatch.setattr(AlertManager, "_post_card", lambda self, card, name: post_card(card, name))
+    manager = AlertManager()
+    manager.send_alert("BTCUSDT", ALERT)
+    manager.close()
+
+    # 发送失败后去重记录被撤销，相同的告警可以再次发送
+    assert manager._dedup.add(AlertManager._dedup_key("BTCUSDT", ALERT)) is True
+
+
+def test_delivered_alert_keeps_dedup_key(monkeypatch):
+    monkeypatch.setenv("FEISHU_WEBHOOK", "http://127.0.0.1:9/hook")
+    monkeypatch.setenv("FEISHU_BATCH_WINDOW", "60")
+    monkeypatch.setattr(AlertManager, "_post_card", lambda self, card, name: True)
+    manager = AlertManager()
+    manager.send_alert("BTCUSDT", ALERT)
+    manager.close()
+
+    assert manager._dedup.add(AlertManager._dedup_key("BTCUSDT", ALERT)) is False
+
+
+class FakeTime:
+    """可控的时钟：sleep 只推进时间，不真正等待"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_waits_after_burst(monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(alert_manager_module, "time", clock)
+    bucket = _TokenBucket(capacity=2, rate=2.0)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    # 空闲期间补充令牌，但不超过容量
+    clock.now += 10
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
@@ -0,0 +1,124 @@
+"""
+缓存测试：TTLCache 的过期与淘汰、采集结果缓存及 force_refresh 跳过缓存
+"""
+import asyncio
+import time
+
+from src.utils.cache import TTLCache
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(maxsize=8, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=10)
+
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get("b") == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_add_only_writes_missing_or_expired_keys():
+    cache = TTLCache(maxsize=8, ttl=0.05)
+
+    assert cache.add("alert") is True
+    assert cache.add("alert") is False
+    time.sleep(0.06)
+    assert cache.add("alert") is True
+
+
+def test_pop_and_clear():
+    cache = TTLCache(maxsize=8, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+    cache.clear()
+    assert len(cache) == 0
+
+
+class CountingCollector:
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    async def acollect(self, symbol):
+        self.calls += 1
+        return dict(self.data)
+
+
+def test_collect_results_are_cached_per_symbol(workflow):
+    collector = CountingCollector({"current_rate": 0.0001})
+
+    async def collect_repeatedly():
+        await workflow._collect_cached("funding_rate", collector, "BTCUSDT")
+        await workflow._collect_cached("funding_rate", collector, "BTCUSDT")
+        await workflow._collect_cached("funding_rate", collector, "ETHUSDT")
+
+    asyncio.run(collect_repeatedly())
+
+    assert collector.calls == 2
+
+
+def test_unavailable_results_are_not_cached(workflow):
+    collector = CountingCollector({"data_available": False})
+
+    async def collect_twice():
+        await workflow._collect_cached("liquidation", collector, "BTCUSDT")
+        await workflow._collect_cached("liquidation", collector, "BTCUSDT")
+
+    asyncio.run(collect_twice())
+
+    assert collector.calls == 2
+
+
+def test_zero_ttl_disables_cache(workflow, monkeypatch):
+    monkeypatch.setitem(workflow._COLLECT_CACHE_TTLS, "kline_volume", 0)
+    collector = CountingCollector({"current_price": 100.0})
+
+    async def collect_twice():
+        await workflow._collect_cached("kline_volume", collector, "BTCUSDT")
+        await workflow._collect_cached("kline_volume", collector, "BTCUSDT")
+
+    asyncio.run(collect_twice())
+
+    assert collector.calls == 2
+
+
+def test_force_refresh_bypasses_and_updates_cache(workflow):
+    collector = CountingCollector({"current_rate": 0.0001})
+
+    async def collect_with_refresh():
+        await workflow._collect_cached("funding_rate", collector, "BTCUSDT")
+        await workflow._collect_cached("funding_rate", collector, "BTCUSDT", force_refresh=True)
+        await workflow._collect_cached("funding_rate", collector, "BTCUSDT")
+
+    asyncio.run(collect_with_refresh())
+
+    assert collector.calls == 2
+
+
+def test_force_refresh_run_collects_again(workflow):
+    workflow.run_trading_analysis("BTCUSDT")
+    workflow.run_trading_analysis("BTCUSDT")
+    funding = workflow._get_component(workflow.FundingRateCollector)
+    assert len(funding.calls) == 1
+
+    workflow.run_trading_analysis("BTCUSDT", force_refresh=True)
+
+    assert len(funding.calls) == 2
@@ -0,0 +1,119 @@
+"""
+工作流检查点测试：只有传入运行 ID 时保存检查点、AI分析失败后续跑、强制刷新、运行异常时的检查点清理
+"""
+import pytest
+
+
+def _run(workflow, symbol, force_refresh=False, run_id="r1"):
+    return workflow.run_trading_analysis(symbol, verbose=False, force_refresh=force_refresh, run_id=run_id)
+
+
+def _agent(workflow):
+    return workflow._get_component(workflow.TradingAgent)
+
+
+def _funding_collector(workflow):
+    return workflow._get_component(workflow.FundingRateCollector)
+
+
+def _stored_threads(workflow):
+    return set(workflow._checkpointer.storage)
+
+
+def test_run_without_run_id_saves_no_checkpoint(workflow):
+    _agent(workflow).fail_times = 1
+
+    state = _run(workflow, "BTCUSDT", run_id=None)
+
+    assert workflow.can_resume(state)
+    assert workflow.get_trading_graph().checkpointer is None
+    assert workflow._resumable_app is None
+    assert _stored_threads(workflow) == set()
+    assert workflow._resumable_threads == {}
+
+
+def test_failed_ai_step_is_kept_for_resume(workflow):
+    _agent(workflow).fail_times = 1
+
+    state = _run(workflow, "BTCUSDT")
+
+    assert state["analysis_result"] is None
+    assert "AI分析失败: llm down" in state["errors"]
+    assert workflow.can_resume(state)
+    assert "BTCUSDT:r1" in workflow._resumable_threads
+    assert "BTCUSDT:r1" in _stored_threads(workflow)
+
+
+def test_resume_skips_collection_and_releases_checkpoint(workflow):
+    _agent(workflow).fail_times = 1
+    _run(workflow, "BTCUSDT")
+    collected = len(_funding_collector(workflow).calls)
+
+    state = _run(workflow, "BTCUSDT")
+
+    assert state["analysis_result"]
+    assert len(_funding_collector(workflow).calls) == collected
+    assert _agent(workflow).calls == 2
+    assert "BTCUSDT:r1" not in workflow._resumable_threads
+    assert "BTCUSDT:r1" not in _stored_threads(workflow)
+
+
+def test_other_run_id_does_not_touch_failed_run(workflow):
+    _agent(workflow).fail_times = 1
+    _run(workflow, "BTCUSDT", run_id="r1")
+
+    state = _run(workflow, "BTCUSDT", force_refresh=True, run_id="r2")
+
+    assert state["analysis_result"]
+    assert "BTCUSDT:r1" in workflow._resumable_threads
+    assert _stored_threads(workflow) == {"BTCUSDT:r1"}
+
+
+def test_force_refresh_after_failure_starts_fresh_run(workflow):
+    _agent(workflow).fail_times = 1
+    _run(workflow, "BTCUSDT")
+
+    state = _run(workflow, "BTCUSDT", force_refresh=True)
+
+    assert state["analysis_result"]
+    assert state["errors"] == []
+    assert len(_funding_collector(workflow).calls) == 2
+    assert "BTCUSDT:r1" not in workflow._resumable_threads
+    assert "BTCUSDT:r1" not in _stored_threads(workflow)
+
+
+def test_successful_run_leaves_no_checkpoint(workflow):
+    state = _run(workflow, "ETHUSDT")
+
+    assert state["analysis_result"]
+    assert state["errors"] == []
+    assert _stored_threads(workflow) == set()
+
+
+def test_expired_checkpoint_is_deleted(workflow, monkeypatch):
+    _agent(workflow).fail_times = 1
+    _run(workflow, "BTCUSDT", run_id="r1")
+
+    monkeypatch.setattr(workflow, "CHECKPOINT_TTL_SECONDS", -1)
+    _run(workflow, "ETHUSDT", run_id="r2")
+
+    assert workflow._resumable_threads == {}
+    assert _stored_threads(workflow) == set()
+
+
+def test_exception_during_run_releases_checkpoint(workflow, monkeypatch):
+    _agent(workflow).fail_times = 1
+    _run(workflow, "BTCUSDT")
+
+    def broken_route(state):
+        raise RuntimeError("route broken")
+
+    # 各节点会捕获自身的异常，这里让路由函数抛出异常，使整个运行失败
+    monkeypatch.setattr(workflow, "_route_after_format", broken_route)
+    monkeypatch.setattr(workflow, "_resumable_app", None)
+
+    with pytest.raises(RuntimeError, match="route broken"):
+        _run(workflow, "BTCUSDT", force_refresh=True)
+
+    assert "BTCUSDT:r1" not in workflow._resumable_threads
+    assert "BTCUSDT:r1" not in _stored_threads(workflow)
@@ -0,0 +1,159 @@
+"""
+数据库测试：只读连接和 read() 查询不占用写锁、新闻去重使用共享连接、嵌套事务与保存点、旧表结构补充字段
+"""
+import sqlite3
+
+import pytest
+
+from src.data_collectors.news_sentiment import NewsSentimentCollector
+from src.database.models import AnalysisRecord, Database, ProcessedNews, get_read_db, get_write_db, init_database
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "trading_agent.db")
+    init_database(path)
+    return path
+
+
+def test_read_only_query_does_not_wait_for_writer(db_path):
+    writer = sqlite3.connect(db_path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute(
+        "INSERT INTO processed_news (symbol, news_id, title, source, published_time, sentiment) "
+        "VALUES ('BTC', 'pending', 't', 's', 1, '')"
+    )
+    try:
+        read_db = Database(db_path, read_only=True)
+        # 写入者持有写锁时，只读连接读取的是已提交的快照
+        assert ProcessedNews.is_processed(read_db, "BTC", "pending") is False
+        assert ProcessedNews.get_latest_timestamp(read_db, "BTC") == 0
+    finally:
+        writer.rollback()
+        writer.close()
+
+
+def test_read_on_writable_connection_does_not_wait_for_writer(db_path):
+    writer = sqlite3.connect(db_path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    db = Database(db_path, persistent=True)
+    try:
+        # BEGIN IMMEDIATE 会等待写锁直到超时，read() 使用 DEFERRED 事务直接读取快照
+        assert AnalysisRecord.get_recent(db, "BTCUSDT") == []
+        assert ProcessedNews.is_processed(db, "BTC", "n1") is False
+        assert db._depth == 0
+    finally:
+        writer.rollback()
+        writer.close()
+        db.close()
+
+
+def test_read_only_connection_rejects_writes(db_path):
+    read_db = Database(db_path, read_only=True)
+
+    assert ProcessedNews.create(read_db, "BTC", "n1", "t", "s", 1, "") is False
+    assert ProcessedNews.is_processed(read_db, "BTC", "n1") is False
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = payload
+
+    def raise_for_status(self):
+        pass
+
+
+def test_crypto_news_dedup_uses_shared_connections(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    init_database()
+    collector = NewsSentimentCollector()
+    collector.cryptocompare_api_key = "test-key"
+    payload = (
+        b'{"Data": [{"title": "Bitcoin rally", "published_on": 1, "source": "a"},'
+        b' {"title": "Exchange hack", "published_on": 2, "source": "b"}]}'
+    )
+    monkeypatch.setattr(collector.session, "get", lambda *args, **kwargs: FakeResponse(payload))
+
+    first = collector._get_crypto_news("BTC")
+    second = collector._get_crypto_news("BTC")
+
+    assert first["new_news_count"] == 2
+    assert second["new_news_count"] == 0
+    assert ProcessedNews.is_processed(get_read_db(), "BTC", first["news_list"][0]["news_id"])
+    assert get_write_db().conn is not None
+
+
+def _insert_news(db, news_id):
+    with db as conn:
+        conn.execute(
+            "INSERT INTO processed_news (symbol, news_id, title, source, published_time, sentiment) "
+            "VALUES ('BTC', ?, 't', 's', 1, '')",
+            (news_id,),
+        )
+
+
+def _news_ids(db_path):
+    with Database(db_path, read_only=True) as conn:
+        return {row["news_id"] for row in conn.execute("SELECT news_id FROM processed_news")}
+
+
+def test_nested_blocks_commit_once_with_outer_transaction(db_path):
+    db = Database(db_path, persistent=True)
+    with db.transaction():
+        _insert_news(db, "n1")
+        _insert_news(db, "n2")
+        # 外层事务提交前，其他连接看不到内层写入
+        assert _news_ids(db_path) == set()
+
+    assert _news_ids(db_path) == {"n1", "n2"}
+    assert db._depth == 0
+    db.close()
+
+
+def test_failed_inner_block_rolls_back_to_its_savepoint(db_path):
+    db = Database(db_path, persistent=True)
+    with db.transaction():
+        _insert_news(db, "n1")
+        with pytest.raises(sqlite3.IntegrityError):
+            with db as conn:
+                conn.execute(
+                    "INSERT INTO processed_news (symbol, news_id, title, source, published_time, sentiment) "
+                    "VALUES ('BTC', 'n2', 't', 's', 1, '')"
+                )
+                conn.execute("INSERT INTO processed_news (symbol) VALUES (NULL)")
+        _insert_news(db, "n3")
+
+    assert _news_ids(db_path) == {"n1", "n3"}
+    db.close()
+
+
+def test_failed_outer_block_rolls_back_everything(db_path):
+    db = Database(db_path, persistent=True)
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            _insert_news(db, "n1")
+            raise RuntimeError("abort batch")
+
+    assert _news_ids(db_path) == set()
+    assert db._depth == 0
+
+    # 回滚后连接仍可继续使用
+    _insert_news(db, "n2")
+    assert _news_ids(db_path) == {"n2"}
+    db.close()
+
+
+def test_init_adds_missing_signal_performance_columns(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE signal_performance (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, analysis_id INTEGER, symbol TEXT NOT NULL,
+        entry_price REAL NOT NULL, entry_time DATETIME NOT NULL)""")
+    conn.close()
+
+    init_database(path)
+    init_database(path)
+
+    with Database(path, read_only=True) as conn:
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(signal_performance)")}
+    assert {"exit_price", "exit_time", "price_change_pct", "is_profitable"} <= columns
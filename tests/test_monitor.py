@@ -0,0 +1,131 @@
+"""
+监控器测试：每轮通过批量分析工作流执行，事件循环和线程池在多轮分析间复用，结果按传入顺序保存，
+AI分析失败时按同一运行 ID 重试，首轮中断时也会关闭监控器
+"""
+import asyncio
+import signal
+import threading
+
+import pytest
+
+import src.core.monitor as monitor_module
+import src.workflow.trading_graph as trading_graph
+from src.database import init_database
+
+ANALYSIS_TEXT = "【市场趋势判断】\n看多 - 理由\n支撑位: $95,000.5\n建议仓位: 轻仓\n信心度: 75%"
+
+
+@pytest.fixture
+def monitor(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("FEISHU_WEBHOOK", raising=False)
+    monkeypatch.setattr(monitor_module, "AccuracyTracker", lambda: None)
+    init_database()
+
+    calls = []
+    run_ids = []
+    ai_failures = set()
+
+    async def fake_analysis(symbol, verbose=False, force_refresh=False, run_id=None):
+        if symbol == "BADUSDT":
+            raise RuntimeError("boom")
+        run_ids.append((symbol, run_id))
+        if symbol in ai_failures:
+            ai_failures.discard(symbol)
+            return {"formatted_data": "data", "analysis_result": None}
+        # 模拟工作流中的 to_thread 采集请求，记录执行的线程和事件循环
+        thread_name = await asyncio.to_thread(lambda: threading.current_thread().name)
+        calls.append((symbol, thread_name, asyncio.get_running_loop()))
+        return {
+            "kline_volume": {"current_price": 100.0, "price_change_pct": 1.5},
+            "funding_rate": {"current_rate": 0.0001},
+            "liquidation": {},
+            "news_sentiment": {},
+            "has_trading_opportunity": False,
+            "triggered_signals": [],
+            "analysis_result": ANALYSIS_TEXT,
+        }
+
+    # 批量分析工作流的每个分支调用 arun_trading_analysis
+    monkeypatch.setattr(trading_graph, "arun_trading_analysis", fake_analysis)
+    monkeypatch.setattr(trading_graph, "_batch_app", None)
+    trading_monitor = monitor_module.TradingMonitor()
+    trading_monitor.calls = calls
+    trading_monitor.run_ids = run_ids
+    trading_monitor.ai_failures = ai_failures
+    yield trading_monitor
+    trading_monitor.close()
+
+
+def test_rounds_reuse_event_loop_and_thread_pool(monitor):
+    first = monitor.analyze_symbols(["BTCUSDT", "ETHUSDT"])
+    second = monitor.analyze_symbols(["BTCUSDT"])
+
+    assert first == {"BTCUSDT": True, "ETHUSDT": True}
+    assert second == {"BTCUSDT": True}
+    assert {loop for _, _, loop in monitor.calls} == {monitor._loop}
+    assert all(name.startswith("monitor") for _, name, _ in monitor.calls)
+    assert monitor.get_analysis_count() == 3
+
+
+def test_failed_symbol_does_not_affect_others(monitor):
+    results = monitor.analyze_symbols(["BTCUSDT", "BADUSDT", "ETHUSDT"])
+
+    assert list(results) == ["BTCUSDT", "BADUSDT", "ETHUSDT"]
+    assert results == {"BTCUSDT": True, "BADUSDT": False, "ETHUSDT": True}
+    assert len(monitor.repo.get_recent_analyses("ETHUSDT")) == 1
+
+
+def test_failed_ai_step_is_retried_with_same_run_id(monitor):
+    monitor.ai_failures.add("BTCUSDT")
+
+    results = monitor.analyze_symbols(["BTCUSDT", "ETHUSDT"])
+
+    assert results == {"BTCUSDT": True, "ETHUSDT": True}
+    assert [symbol for symbol, _ in monitor.run_ids].count("BTCUSDT") == 2
+    assert [symbol for symbol, _ in monitor.run_ids].count("ETHUSDT") == 1
+    assert len({run_id for _, run_id in monitor.run_ids}) == 1
+
+    monitor.analyze_symbols(["BTCUSDT"])
+    assert len({run_id for _, run_id in monitor.run_ids}) == 2
+
+
+def test_concurrent_analyses_are_limited(monitor, monkeypatch):
+    monkeypatch.setattr(monitor_module, "MAX_CONCURRENT_ANALYSES", 2)
+    running = []
+    peak = []
+    original = trading_graph.arun_trading_analysis
+
+    async def tracked_analysis(symbol, verbose=False, force_refresh=False, run_id=None):
+        running.append(symbol)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        try:
+            return await original(symbol, verbose, force_refresh, run_id)
+        finally:
+            running.remove(symbol)
+
+    monkeypatch.setattr(trading_graph, "arun_trading_analysis", tracked_analysis)
+
+    results = monitor.analyze_symbols(["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT"])
+
+    assert all(results.values())
+    assert max(peak) == 2
+
+
+def test_interrupted_first_round_still_closes_monitor(monkeypatch, monitor):
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    monkeypatch.setattr(monitor_module, "TradingMonitor", lambda: monitor)
+
+    def interrupted(symbols, verbose=False):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(monitor, "analyze_symbols", interrupted)
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            monitor_module.run_monitor_mode(["BTCUSDT"], interval=15)
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+
+    assert monitor._loop.is_closed()
+    assert monitor._pool._shutdown
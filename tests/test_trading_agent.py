@@ -0,0 +1,37 @@
+"""
+交易智能体测试：冲突环境变量只在创建客户端时清除，分析调用不修改环境变量
+"""
+import os
+
+from langchain_core.messages import AIMessageChunk
+
+from config.settings import settings
+from src.agent.trading_agent import TradingAgent
+
+
+def test_client_is_built_without_conflicting_env(monkeypatch):
+    monkeypatch.setattr(settings, "get_llm_api_key", lambda: "test-key")
+    monkeypatch.setattr(settings, "LLM_API_BASE_URL", "")
+    monkeypatch.setenv("ANTHROPIC_AUTH_TOKEN", "conflicting-token")
+
+    agent = TradingAgent()
+
+    assert agent.llm._client.auth_token is None
+    assert agent.llm._client.api_key == "test-key"
+    assert os.environ["ANTHROPIC_AUTH_TOKEN"] == "conflicting-token"
+
+
+def test_analyze_leaves_environment_untouched(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_AUTH_TOKEN", "conflicting-token")
+    seen = []
+
+    class EnvCheckingLLM:
+        def stream(self, messages):
+            seen.append(os.environ.get("ANTHROPIC_AUTH_TOKEN"))
+            yield AIMessageChunk(content="看多")
+
+    agent = TradingAgent.__new__(TradingAgent)
+    agent.llm = EnvCheckingLLM()
+
+    assert agent.analyze("market data") == "看多"
+    assert seen == ["conflicting-token"]
@@ -0,0 +1,74 @@
+"""
+工作流测试：行情预判后的路由、批量分析
+"""
+from config.settings import settings
+
+
+def test_missing_data_ends_after_signal_detection(workflow, monkeypatch):
+    async def failing_collect(self, symbol):
+        raise RuntimeError("exchange down")
+
+    monkeypatch.setattr(workflow.KlineVolumeCollector, "acollect", failing_collect)
+
+    state = workflow.run_trading_analysis("BTCUSDT")
+
+    assert state["signal_summary"] == "数据不足，无法分析"
+    assert state["has_trading_opportunity"] is False
+    assert state["formatted_data"] is None
+    assert "K线数据采集失败: exchange down" in state["errors"]
+    assert workflow._get_component(workflow.TradingAgent).calls == 0
+
+
+def test_no_opportunity_ends_after_signal_detection(workflow, monkeypatch):
+    monkeypatch.setattr(settings, "MIN_SIGNAL_COUNT", 99)
+
+    state = workflow.run_trading_analysis("BTCUSDT")
+
+    assert state["has_trading_opportunity"] is False
+    assert state["formatted_data"] is None
+    assert state["analysis_result"].startswith("【无需分析】")
+    assert workflow._get_component(workflow.TradingAgent).calls == 0
+
+
+def test_opportunity_runs_ai_analysis(workflow):
+    state = workflow.run_trading_analysis("BTCUSDT")
+
+    assert state["has_trading_opportunity"] is True
+    assert state["triggered_signals"]
+    assert state["formatted_data"]
+    assert "信心度: 70%" in state["analysis_result"]
+    assert state["errors"] == []
+
+
+def test_batch_analysis_returns_results_in_input_order(workflow):
+    results = workflow.run_trading_analysis_batch(["ETHUSDT", "BTCUSDT", "ETHUSDT"], max_concurrency=2)
+
+    assert list(results) == ["ETHUSDT", "BTCUSDT"]
+    assert all(state["analysis_result"] for state in results.values())
+    funding = workflow._get_component(workflow.FundingRateCollector)
+    assert sorted(funding.calls) == ["BTCUSDT", "ETHUSDT"]
+
+
+def test_batch_analysis_isolates_failed_symbol(workflow, monkeypatch):
+    original = workflow.arun_trading_analysis
+
+    async def flaky_analysis(symbol, verbose=False, force_refresh=False, run_id=None):
+        if symbol == "BADUSDT":
+            raise RuntimeError("boom")
+        return await original(symbol, verbose, force_refresh, run_id)
+
+    monkeypatch.setattr(workflow, "arun_trading_analysis", flaky_analysis)
+
+    results = workflow.run_trading_analysis_batch(["BTCUSDT", "BADUSDT"])
+
+    assert results["BADUSDT"] is None
+    assert results["BTCUSDT"]["analysis_result"]
+
+
+def test_batch_run_id_is_passed_to_each_symbol(workflow):
+    workflow._get_component(workflow.TradingAgent).fail_times = 1
+
+    results = workflow.run_trading_analysis_batch(["BTCUSDT"], run_id="round1")
+
+    assert workflow.can_resume(results["BTCUSDT"])
+    assert "BTCUSDT:round1" in workflow._resumable_threads